@@ -4,8 +4,8 @@ Lambda handler for processing CSV files from S3 and loading into DynamoDB.
 Triggered by S3 ObjectCreated events for .csv files.
 Parses CSV, uses first row as headers, and writes each row to DynamoDB.
 """
+import codecs
 import csv
-import io
 import json
 import os
 import time
@@ -17,12 +17,12 @@ s3 = boto3.client("s3")
 dynamodb = boto3.resource("dynamodb")
 
 TABLE_NAME = os.environ.get("TABLE_NAME", "csv-data-dev")
+table = dynamodb.Table(TABLE_NAME)
+_utf8_reader = codecs.getreader("utf-8")
 
 
 def lambda_handler(event, context):
     """Process S3 event and load CSV data into DynamoDB."""
-    table = dynamodb.Table(TABLE_NAME)
-    
     results = []
     
     for record in event.get("Records", []):
@@ -33,12 +33,10 @@ def lambda_handler(event, context):
         print(f"Processing s3://{bucket}/{key}")
         
         try:
-            # Get the CSV file from S3
+            # Stream the CSV from S3, decoding incrementally rather than
+            # buffering the whole object as bytes and again as a str
             response = s3.get_object(Bucket=bucket, Key=key)
-            content = response["Body"].read().decode("utf-8")
-            
-            # Parse CSV
-            reader = csv.DictReader(io.StringIO(content))
+            reader = csv.DictReader(_utf8_reader(response["Body"]))
             rows_processed = 0
             
             # Use batch writer for efficient DynamoDB writes
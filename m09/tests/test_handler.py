@@ -0,0 +1,33 @@
+"""Tokenizer checks for the word frequency handler (run with pytest)."""
+import json
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from handler import handler
+
+
+def _counts(text):
+    body = json.loads(handler({"text": text}, None)["body"])
+    return body["total_words"], {w["word"]: w["count"] for w in body["top_10"]}
+
+
+def test_non_ascii_letters_do_not_form_made_up_words():
+    # "naïve" is not an ASCII word; it must not be counted as "nave" or "na"/"ve"
+    total, words = _counts("a naïve fox")
+    assert words == {"a": 1, "fox": 1}
+    assert total == 2
+
+
+def test_digits_do_not_split_tokens():
+    # "abc123" is one word token that isn't all letters, not the word "abc"
+    total, words = _counts("abc123 abc")
+    assert words == {"abc": 1}
+    assert total == 1
+
+
+def test_case_and_punctuation_are_normalized():
+    total, words = _counts("The fox. the FOX, the!")
+    assert words == {"the": 3, "fox": 2}
+    assert total == 5
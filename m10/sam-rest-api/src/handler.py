@@ -1,53 +1,78 @@
 from __future__ import annotations
 import json
-from datetime import datetime, timezone
+import re
+import time
 
 REQUIRED_FIELDS = ["name", "email", "age"]
+_REQUIRED = frozenset(REQUIRED_FIELDS)
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_HEADERS = {"content-type": "application/json"}
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
 
 
 def handler(event, context):
     method = event.get("httpMethod", "GET").upper()
     path = event.get("path", "")
 
-    if method == "GET" and path.endswith("/health"):
-        return {
-            "statusCode": 200,
-            "headers": {"content-type": "application/json"},
-            "body": json.dumps({"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()})
-        }
+    # One dict lookup on (method, last path segment) instead of chained endswith checks
+    route = _ROUTES.get((method, "/" + path.rsplit("/", 1)[-1]))
+    if route is None:
+        return error_response(404, f"Not found: {method} {path}")
+    return route(event)
 
-    if method == "POST" and path.endswith("/validate"):
-        # Parse body
-        try:
-            body = json.loads(event.get("body") or "{}")
-        except json.JSONDecodeError:
-            return error_response(400, "Invalid JSON in request body")
 
-        # Validate required fields
-        errors = []
-        for field in REQUIRED_FIELDS:
-            if field not in body:
-                errors.append({"field": field, "error": "required"})
+def _health(event):
+    return {
+        "statusCode": 200,
+        "headers": _HEADERS,
+        "body": _dumps({"status": "healthy", "timestamp": _iso_now()})
+    }
+
+
+def _validate(event):
+    # Parse body
+    try:
+        body = json.loads(event.get("body") or "{}")
+    except json.JSONDecodeError:
+        return error_response(400, "Invalid JSON in request body")
+    if not isinstance(body, dict):
+        return error_response(400, "Request body must be a JSON object")
+
+    # Validate required fields
+    errors = []
+    missing = _REQUIRED - body.keys()
+    if missing:
+        errors.extend({"field": f, "error": "required"} for f in REQUIRED_FIELDS if f in missing)
+
+    # Validate types
+    if "age" in body:
+        if not isinstance(body["age"], (int, float)) or body["age"] < 0 or body["age"] > 150:
+            errors.append({"field": "age", "error": "must be a number between 0 and 150"})
 
-        # Validate types
-        if "age" in body:
-            if not isinstance(body["age"], (int, float)) or body["age"] < 0 or body["age"] > 150:
-                errors.append({"field": "age", "error": "must be a number between 0 and 150"})
+    if "email" in body:
+        if not isinstance(body["email"], str) or not _EMAIL_RE.fullmatch(body["email"]):
+            errors.append({"field": "email", "error": "must be a valid email address"})
+
+    if errors:
+        return error_response(422, "Validation failed", errors)
+
+    return {
+        "statusCode": 200,
+        "headers": _HEADERS,
+        "body": _dumps({"valid": True, "data": body, "validated_at": _iso_now()})
+    }
 
-        if "email" in body:
-            if not isinstance(body["email"], str) or "@" not in body["email"]:
-                errors.append({"field": "email", "error": "must be a valid email address"})
 
-        if errors:
-            return error_response(422, "Validation failed", errors)
+def _iso_now():
+    """UTC ISO-8601 timestamp with millisecond precision, without datetime objects."""
+    t = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t)) + f".{int(t % 1 * 1000):03d}Z"
 
-        return {
-            "statusCode": 200,
-            "headers": {"content-type": "application/json"},
-            "body": json.dumps({"valid": True, "data": body, "validated_at": datetime.now(timezone.utc).isoformat()})
-        }
 
-    return error_response(404, f"Not found: {method} {path}")
+_ROUTES = {
+    ("GET", "/health"): _health,
+    ("POST", "/validate"): _validate,
+}
 
 
 def error_response(code, message, errors=None):
@@ -56,6 +81,6 @@ def error_response(code, message, errors=None):
         body["validation_errors"] = errors
     return {
         "statusCode": code,
-        "headers": {"content-type": "application/json"},
-        "body": json.dumps(body)
+        "headers": _HEADERS,
+        "body": _dumps(body)
     }
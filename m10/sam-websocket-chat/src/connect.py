@@ -4,9 +4,20 @@ import boto3
 
 ddb = boto3.client("dynamodb")
 TABLE = os.environ["TABLE_NAME"]
+ROOM = "global"
 
 
 def handler(event, context):
     cid = event["requestContext"]["connectionId"]
-    ddb.put_item(TableName=TABLE, Item={"connectionId": {"S": cid}})
+    try:
+        # Fail fast on a duplicate $connect instead of rewriting the same item
+        ddb.put_item(
+            TableName=TABLE,
+            Item={"connectionId": {"S": cid}, "roomId": {"S": ROOM}},
+            ConditionExpression="attribute_not_exists(connectionId)",
+            ReturnValues="NONE",
+            ReturnConsumedCapacity="NONE",
+        )
+    except ddb.exceptions.ConditionalCheckFailedException:
+        pass  # already registered
     return {"statusCode": 200, "body": "connected"}
@@ -8,5 +8,11 @@ TABLE = os.environ["TABLE_NAME"]
 
 def handler(event, context):
     cid = event["requestContext"]["connectionId"]
-    ddb.delete_item(TableName=TABLE, Key={"connectionId": {"S": cid}})
+    # DeleteItem is idempotent; skip returning the old item or capacity stats
+    ddb.delete_item(
+        TableName=TABLE,
+        Key={"connectionId": {"S": cid}},
+        ReturnValues="NONE",
+        ReturnConsumedCapacity="NONE",
+    )
     return {"statusCode": 200, "body": "disconnected"}
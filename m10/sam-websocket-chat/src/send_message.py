@@ -5,21 +5,42 @@ import boto3
 
 ddb = boto3.client("dynamodb")
 TABLE = os.environ["TABLE_NAME"]
+ROOM = "global"
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+# Management API clients keyed by (domain, stage); built once per warm container.
+_clients: dict[tuple[str, str], object] = {}
+
+
+def _mgmt(domain, stage):
+    key = (domain, stage)
+    api = _clients.get(key)
+    if api is None:
+        api = _clients[key] = boto3.client(
+            "apigatewaymanagementapi", endpoint_url=f"https://{domain}/{stage}"
+        )
+    return api
 
 
 def handler(event, context):
     domain = event["requestContext"]["domainName"]
     stage = event["requestContext"]["stage"]
-    api = boto3.client("apigatewaymanagementapi", endpoint_url=f"https://{domain}/{stage}")
+    api = _mgmt(domain, stage)
 
     body = json.loads(event.get("body") or "{}")
     msg = body.get("message", "")
+    data = _dumps({"message": msg}).encode("utf-8")
 
-    conns = ddb.scan(TableName=TABLE).get("Items", [])
+    conns = ddb.query(
+        TableName=TABLE,
+        IndexName="byRoom",
+        KeyConditionExpression="roomId = :r",
+        ExpressionAttributeValues={":r": {"S": ROOM}},
+    ).get("Items", [])
     for c in conns:
         cid = c["connectionId"]["S"]
         try:
-            api.post_to_connection(ConnectionId=cid, Data=json.dumps({"message": msg}).encode("utf-8"))
+            api.post_to_connection(ConnectionId=cid, Data=data)
         except Exception:
             ddb.delete_item(TableName=TABLE, Key={"connectionId": {"S": cid}})
     return {"statusCode": 200, "body": "sent"}
@@ -107,11 +107,30 @@ def run(args):
     info("In production you would fix the bug first, then redrive.\n")
 
     redriven = 0
-    for m in dlq_messages:
-        sqs.send_message(QueueUrl=main_url, MessageBody=json.dumps(m["body"]))
-        sqs.delete_message(QueueUrl=dlq_url, ReceiptHandle=m["handle"])
-        redriven += 1
-        info(f"Redrove: {m['body']['taskId']} -> main queue")
+    if dlq_messages:
+        # One SendMessageBatch + one DeleteMessageBatch instead of 2 calls per message
+        sent = sqs.send_message_batch(
+            QueueUrl=main_url,
+            Entries=[
+                {"Id": str(i), "MessageBody": json.dumps(m["body"])}
+                for i, m in enumerate(dlq_messages)
+            ],
+        )
+        ok_ids = {e["Id"] for e in sent.get("Successful", [])}
+        moved = [m for i, m in enumerate(dlq_messages) if str(i) in ok_ids]
+        for f in sent.get("Failed", []):
+            warn(f"Could not redrive {dlq_messages[int(f['Id'])]['body']['taskId']}: {f.get('Message')}")
+        if moved:
+            deleted = sqs.delete_message_batch(
+                QueueUrl=dlq_url,
+                Entries=[{"Id": str(i), "ReceiptHandle": m["handle"]} for i, m in enumerate(moved)],
+            )
+            # A failed delete leaves a copy in the DLQ next to the redriven one
+            for f in deleted.get("Failed", []):
+                warn(f"Redrove {moved[int(f['Id'])]['body']['taskId']} but could not remove it from the DLQ: {f.get('Message')}")
+        for m in moved:
+            info(f"Redrove: {m['body']['taskId']} -> main queue")
+        redriven = len(moved)
 
     if redriven:
         success(f"Redrove {redriven} message(s) back to main queue for reprocessing")
@@ -128,10 +147,16 @@ def run(args):
     )
     recovered = resp.get("Messages", [])
     kv("Messages recovered", len(recovered))
-    for msg in recovered:
+    processed = []
+    for i, msg in enumerate(recovered):
         body = json.loads(msg["Body"])
         success(f"Recovered: {body['taskId']}")
-        sqs.delete_message(QueueUrl=main_url, ReceiptHandle=msg["ReceiptHandle"])
+        processed.append({"Id": str(i), "ReceiptHandle": msg["ReceiptHandle"]})
+    if processed:
+        # Acknowledge the whole batch in one call (up to 10 entries)
+        resp = sqs.delete_message_batch(QueueUrl=main_url, Entries=processed)
+        for f in resp.get("Failed", []):
+            warn(f"Could not delete message {f['Id']}: {f.get('Message')}")
 
     if recovered:
         success("DLQ recovery cycle complete")
@@ -1,13 +1,13 @@
 """SNS/SQS fan-out pattern: one message delivered to multiple subscribers."""
 import json
 import time
-import threading
 import sys
 import pathlib
+from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent.parent))
 
-from common import create_session, banner, step, success, info, kv, generate_name, track_resource
+from common import create_session, banner, step, success, fail, info, kv, generate_name, track_resource
 
 
 def run(args):
@@ -25,8 +25,9 @@ def run(args):
 
     # Step 2: Create 2 SQS queues (orders-svc and analytics-svc)
     step(2, "Creating SQS subscriber queues")
-    queue_urls = []
-    for svc in ["orders-svc", "analytics-svc"]:
+
+    def provision_subscriber(svc):
+        """Create, authorize, and subscribe one queue. Returns its URL."""
         q_name = generate_name(svc, args.prefix)
         q_url = sqs.create_queue(QueueName=q_name)["QueueUrl"]
         q_arn = sqs.get_queue_attributes(
@@ -49,57 +50,96 @@ def run(args):
             Attributes={"Policy": json.dumps(policy)},
         )
         sns.subscribe(TopicArn=topic_arn, Protocol="sqs", Endpoint=q_arn)
-        queue_urls.append(q_url)
+        return q_url
+
+    # Each subscriber's 4 calls depend on each other, but subscribers don't:
+    # provision them concurrently so setup costs one chain, not N.
+    svcs = ["orders-svc", "analytics-svc"]
+    with ThreadPoolExecutor(max_workers=len(svcs)) as pool:
+        queue_urls = list(pool.map(provision_subscriber, svcs))
+    for svc, q_url in zip(svcs, queue_urls):
         track_resource("m11", "sqs_queue", q_url)
         success(f"Queue: {svc} -> subscribed")
 
-    # Step 3: Publish messages
-    step(3, "Publishing 5 order events to SNS")
-    for i in range(5):
-        order = {
-            "orderId": f"ORD-{i + 1:03d}",
-            "customer": f"customer-{i + 1}",
-            "total": round(19.99 + i * 10, 2),
-        }
-        sns.publish(TopicArn=topic_arn, Message=json.dumps(order))
-        info(f"Published: {order['orderId']} (${order['total']})")
-    success("All messages published")
-
-    # Step 4: Poll both queues simultaneously using threads
-    step(4, "Polling both subscriber queues (fan-out in action)")
-    info("Each message should appear in BOTH queues...\n")
+    # Start long-polling both queues before publishing so each receive is
+    # already parked on the queue when the fan-out deliveries land.
+    results = {svc: [] for svc in svcs}
 
-    results = {"orders-svc": [], "analytics-svc": []}
+    deadline = time.time() + 20  # one 20 second budget shared by both pollers
 
     def poll_queue(queue_url, label, result_list):
-        deadline = time.time() + 15  # 15 second timeout
-        while time.time() < deadline and len(result_list) < 5:
+        while len(result_list) < 5 and time.time() < deadline:
+            # Full long poll: returns as soon as messages arrive, never past the deadline
             resp = sqs.receive_message(
                 QueueUrl=queue_url,
-                MaxNumberOfMessages=5,
-                WaitTimeSeconds=3,
+                MaxNumberOfMessages=10,
+                WaitTimeSeconds=max(1, min(20, int(deadline - time.time()))),
             )
-            for msg in resp.get("Messages", []):
+            msgs = resp.get("Messages", [])
+            for msg in msgs:
                 body = json.loads(msg["Body"])
                 payload = json.loads(body.get("Message", "{}"))
                 result_list.append(payload)
-                sqs.delete_message(
+            if msgs:
+                # Acknowledge the whole receive in one DeleteMessageBatch
+                deleted = sqs.delete_message_batch(
                     QueueUrl=queue_url,
-                    ReceiptHandle=msg["ReceiptHandle"],
+                    Entries=[
+                        {"Id": str(i), "ReceiptHandle": m["ReceiptHandle"]}
+                        for i, m in enumerate(msgs)
+                    ],
                 )
+                for f in deleted.get("Failed", []):
+                    fail(f"{label}: could not delete message {f['Id']}: {f.get('Message')}")
+
+    pollers = ThreadPoolExecutor(max_workers=len(queue_urls))
+    try:
+        polls = [
+            pollers.submit(poll_queue, q_url, svc, results[svc])
+            for q_url, svc in zip(queue_urls, svcs)
+        ]
+
+        # Step 3: Publish messages
+        step(3, "Publishing 5 order events to SNS")
+        orders = [
+            {
+                "orderId": f"ORD-{i + 1:03d}",
+                "customer": f"customer-{i + 1}",
+                "total": round(19.99 + i * 10, 2),
+            }
+            for i in range(5)
+        ]
+        # Serialize each payload once, then send one PublishBatch request
+        # (up to 10 entries) instead of one Publish per order
+        messages = [json.dumps(order, separators=(",", ":")) for order in orders]
+        resp = sns.publish_batch(
+            TopicArn=topic_arn,
+            PublishBatchRequestEntries=[
+                {"Id": f"msg-{i}", "Message": message}
+                for i, message in enumerate(messages)
+            ],
+        )
+        published = {e["Id"] for e in resp.get("Successful", [])}
+        for i, order in enumerate(orders):
+            if f"msg-{i}" in published:
+                info(f"Published: {order['orderId']} (${order['total']})")
+        for f in resp.get("Failed", []):
+            fail(f"Publish failed for {f['Id']}: {f.get('Message', f.get('Code'))}")
+        if len(published) == len(orders):
+            success("All messages published")
 
-    t1 = threading.Thread(
-        target=poll_queue,
-        args=(queue_urls[0], "orders-svc", results["orders-svc"]),
-    )
-    t2 = threading.Thread(
-        target=poll_queue,
-        args=(queue_urls[1], "analytics-svc", results["analytics-svc"]),
-    )
-    t1.start()
-    t2.start()
-    t1.join()
-    t2.join()
+        # Step 4: Collect what both pollers received
+        step(4, "Polling both subscriber queues (fan-out in action)")
+        info("Each message should appear in BOTH queues...\n")
+        # Block once for both pollers; each exits on its own when it has all
+        # 5 messages or the shared deadline passes.
+        wait(polls, return_when=ALL_COMPLETED)
+        for svc, fut in zip(svcs, polls):
+            if fut.exception():
+                fail(f"{svc} poller failed: {fut.exception()}")
+    finally:
+        # Runs even if publishing fails, so the poller threads are always joined
+        pollers.shutdown(cancel_futures=True)
 
     # Step 5: Show results
     step(5, "Fan-out results")
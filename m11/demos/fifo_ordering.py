@@ -3,6 +3,7 @@ import json
 import time
 import sys
 import pathlib
+from collections import defaultdict
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent.parent))
 
@@ -49,38 +50,43 @@ def run(args):
         {"step": "gamma", "action": "finalize"},
     ]
 
-    for msg in group_a_messages:
-        sqs.send_message(
-            QueueUrl=q_url,
-            MessageBody=json.dumps(msg),
-            MessageGroupId="group-A",
-        )
-        info(f"Sent to group-A: {msg['step']} ({msg['action']})")
-
-    for msg in group_b_messages:
-        sqs.send_message(
-            QueueUrl=q_url,
-            MessageBody=json.dumps(msg),
-            MessageGroupId="group-B",
-        )
-        info(f"Sent to group-B: {msg['step']} ({msg['action']})")
-
-    success("All 6 messages sent (3 per group)")
+    # One SendMessageBatch (up to 10 entries); FIFO keeps batch order within each group
+    outgoing = (
+        [("group-A", f"a-{i}", m) for i, m in enumerate(group_a_messages)]
+        + [("group-B", f"b-{i}", m) for i, m in enumerate(group_b_messages)]
+    )
+    resp = sqs.send_message_batch(
+        QueueUrl=q_url,
+        Entries=[
+            {"Id": entry_id, "MessageBody": json.dumps(msg, separators=(",", ":")), "MessageGroupId": group}
+            for group, entry_id, msg in outgoing
+        ],
+    )
+    sent_ids = {e["Id"] for e in resp.get("Successful", [])}
+    for group, entry_id, msg in outgoing:
+        if entry_id in sent_ids:
+            info(f"Sent to {group}: {msg['step']} ({msg['action']})")
+    for f in resp.get("Failed", []):
+        warn(f"Send failed for {f['Id']}: {f.get('Message', f.get('Code'))}")
+
+    if len(sent_ids) == len(outgoing):
+        success("All 6 messages sent (3 per group)")
 
     # Step 3: Receive all messages
     step(3, "Receiving all messages from FIFO queue")
-    time.sleep(2)  # Brief pause to ensure delivery
 
     received = []
-    deadline = time.time() + 15
+    deadline = time.time() + 20
     while time.time() < deadline and len(received) < 6:
+        # Full long poll: returns as soon as messages arrive, never past the deadline
         resp = sqs.receive_message(
             QueueUrl=q_url,
             MaxNumberOfMessages=10,
-            WaitTimeSeconds=3,
+            WaitTimeSeconds=max(1, min(20, int(deadline - time.time()))),
             AttributeNames=["MessageGroupId", "SequenceNumber"],
         )
-        for msg in resp.get("Messages", []):
+        msgs = resp.get("Messages", [])
+        for msg in msgs:
             body = json.loads(msg["Body"])
             attrs = msg.get("Attributes", {})
             received.append({
@@ -89,20 +95,35 @@ def run(args):
                 "action": body["action"],
                 "sequence": attrs.get("SequenceNumber", "?"),
             })
-            sqs.delete_message(QueueUrl=q_url, ReceiptHandle=msg["ReceiptHandle"])
+        if msgs:
+            # Acknowledge the whole receive in one DeleteMessageBatch
+            deleted = sqs.delete_message_batch(
+                QueueUrl=q_url,
+                Entries=[
+                    {"Id": str(i), "ReceiptHandle": m["ReceiptHandle"]}
+                    for i, m in enumerate(msgs)
+                ],
+            )
+            for f in deleted.get("Failed", []):
+                warn(f"Could not delete message {f['Id']}: {f.get('Message')}")
 
     kv("Total received", len(received))
 
     # Step 4: Show that within each group, order is preserved
     step(4, "Verifying ordering within each message group")
 
-    group_a_received = [m for m in received if m["group"] == "group-A"]
-    group_b_received = [m for m in received if m["group"] == "group-B"]
+    # Group in a single pass over the received messages
+    groups = defaultdict(list)
+    for m in received:
+        groups[m["group"]].append(m)
+    group_a_received = groups["group-A"]
+    group_b_received = groups["group-B"]
 
     info("Group A (pipeline steps):")
-    rows_a = []
-    for i, m in enumerate(group_a_received):
-        rows_a.append([str(i + 1), m["step"], m["action"], m["sequence"]])
+    rows_a = [
+        [str(i + 1), m["step"], m["action"], m["sequence"]]
+        for i, m in enumerate(group_a_received)
+    ]
     if rows_a:
         table(["Order", "Step", "Action", "Sequence#"], rows_a)
 
@@ -115,9 +136,10 @@ def run(args):
         warn("Group A: no messages received yet")
 
     info("Group B (alphabetical items):")
-    rows_b = []
-    for i, m in enumerate(group_b_received):
-        rows_b.append([str(i + 1), m["step"], m["action"], m["sequence"]])
+    rows_b = [
+        [str(i + 1), m["step"], m["action"], m["sequence"]]
+        for i, m in enumerate(group_b_received)
+    ]
     if rows_b:
         table(["Order", "Step", "Action", "Sequence#"], rows_b)
 
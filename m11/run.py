@@ -2,6 +2,8 @@
 """m11 - Async Patterns: SNS/SQS fan-out, dead-letter queues, FIFO ordering."""
 import sys
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
 
@@ -36,16 +38,21 @@ def cleanup(args):
     session = create_session(args.profile, args.region)
     sns = session.client("sns")
     sqs = session.client("sqs")
-    for r in resources:
+
+    def _delete(r):
         try:
             if r["type"] == "sns_topic":
                 # Unsubscribe all subscriptions first
                 subs = sns.list_subscriptions_by_topic(
                     TopicArn=r["id"]
                 ).get("Subscriptions", [])
-                for s in subs:
-                    if s["SubscriptionArn"] != "PendingConfirmation":
-                        sns.unsubscribe(SubscriptionArn=s["SubscriptionArn"])
+                arns = [
+                    a for a in map(itemgetter("SubscriptionArn"), subs)
+                    if a != "PendingConfirmation"
+                ]
+                if arns:
+                    with ThreadPoolExecutor(max_workers=min(10, len(arns))) as pool:
+                        list(pool.map(lambda a: sns.unsubscribe(SubscriptionArn=a), arns))
                 sns.delete_topic(TopicArn=r["id"])
                 success(f"Deleted topic: {r['id']}")
             elif r["type"] == "sqs_queue":
@@ -53,6 +60,10 @@ def cleanup(args):
                 success(f"Deleted queue: {r['id']}")
         except Exception as e:
             info(f"Could not delete {r['id']}: {e}")
+
+    # Resources are independent, so tear them down concurrently
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(_delete, resources))
     clear_tracked("m11")
 
 
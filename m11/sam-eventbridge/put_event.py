@@ -23,6 +23,7 @@ def main():
     events = session.client("events")
 
     detail = json.loads(args.detail)
+    detail_json = json.dumps(detail, separators=(",", ":"))  # serialized once for the API call
 
     step(1, "Publishing custom event")
     kv("Source", "awsdev.orders")
@@ -32,7 +33,7 @@ def main():
     response = events.put_events(Entries=[{
         "Source": "awsdev.orders",
         "DetailType": "OrderCreated",
-        "Detail": json.dumps(detail),
+        "Detail": detail_json,
     }])
 
     success(f"Event published (FailedEntryCount={response.get('FailedEntryCount', 0)})")
@@ -1,7 +1,10 @@
 from __future__ import annotations
+import asyncio
 import os
+import time
+from functools import lru_cache
 import jwt
-from jwt import PyJWKClient
+from jwt import PyJWK, PyJWKClient
 from fastapi import FastAPI, Header, HTTPException
 
 app = FastAPI()
@@ -9,6 +12,12 @@ app = FastAPI()
 REGION = os.environ.get("COGNITO_REGION")
 USERPOOL_ID = os.environ.get("COGNITO_USERPOOL_ID")
 APP_CLIENT_ID = os.environ.get("COGNITO_APP_CLIENT_ID")
+_DECODE_OPTIONS = {"verify_exp": True}
+_KID_INDEX: dict[str, PyJWK] = {}
+_REFRESH_LOCK = asyncio.Lock()
+# Tokens with unknown kids can't force a JWKS fetch more often than this
+JWKS_MIN_REFRESH_SECONDS = 60
+_last_refresh = float("-inf")
 
 
 def jwks_url() -> str:
@@ -17,11 +26,44 @@ def jwks_url() -> str:
     return f"https://cognito-idp.{REGION}.amazonaws.com/{USERPOOL_ID}/.well-known/jwks.json"
 
 
-def verify(token: str) -> dict:
-    jwks = PyJWKClient(jwks_url())
-    key = jwks.get_signing_key_from_jwt(token).key
+@lru_cache(maxsize=1)
+def jwks_client() -> PyJWKClient:
+    """One JWKS client per process so its signing-key cache survives across requests."""
+    return PyJWKClient(jwks_url(), cache_keys=True, lifespan=3600)
+
+
+def _refresh_keys(refresh: bool = False) -> None:
+    global _KID_INDEX, _last_refresh
+    _last_refresh = time.monotonic()
+    # Swap in a new dict so readers on the event loop never see a half-built index
+    _KID_INDEX = {k.key_id: k for k in jwks_client().get_signing_keys(refresh=refresh)}
+
+
+async def signing_key(kid: str | None):
+    """Look up a signing key by kid, re-fetching the JWKS once on a miss (key rotation).
+
+    Hits never leave the event loop. A miss fetches the JWKS on a worker thread,
+    and the lock coalesces concurrent misses into a single fetch. Once keys are
+    loaded, misses within JWKS_MIN_REFRESH_SECONDS of the last fetch fail
+    without refetching, so forged kids can't hammer the JWKS endpoint.
+    """
+    jwk = _KID_INDEX.get(kid)
+    if jwk is None:
+        async with _REFRESH_LOCK:
+            jwk = _KID_INDEX.get(kid)
+            stale = time.monotonic() - _last_refresh >= JWKS_MIN_REFRESH_SECONDS
+            if jwk is None and (not _KID_INDEX or stale):
+                await asyncio.to_thread(_refresh_keys, bool(_KID_INDEX))
+                jwk = _KID_INDEX.get(kid)
+        if jwk is None:
+            raise jwt.PyJWKClientError(f'Unable to find a signing key that matches: "{kid}"')
+    return jwk.key
+
+
+async def verify(token: str) -> dict:
     try:
-        return jwt.decode(token, key, algorithms=["RS256"], audience=APP_CLIENT_ID, options={"verify_exp": True})
+        key = await signing_key(jwt.get_unverified_header(token).get("kid"))
+        return jwt.decode(token, key, algorithms=["RS256"], audience=APP_CLIENT_ID, options=_DECODE_OPTIONS)
     except jwt.PyJWTError as e:
         raise HTTPException(status_code=401, detail=str(e))
 
@@ -32,8 +74,8 @@ def public():
 
 
 @app.get("/private")
-def private(authorization: str | None = Header(default=None)):
+async def private(authorization: str | None = Header(default=None)):
     if not authorization or not authorization.lower().startswith("bearer "):
         raise HTTPException(status_code=401, detail="Missing Bearer token")
-    claims = verify(authorization.split(" ", 1)[1].strip())
+    claims = await verify(authorization.split(" ", 1)[1].strip())
     return {"ok": True, "claims": claims}
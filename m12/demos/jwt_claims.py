@@ -0,0 +1,20 @@
+"""Decode JWT claims without verifying the signature (display only)."""
+import base64
+import json
+
+
+def _payload(token: str) -> str:
+    """Slice out the middle (payload) segment without splitting the whole token."""
+    first = token.index(".")
+    return token[first + 1:token.index(".", first + 1)]
+
+
+def decode_claims(token: str) -> dict:
+    """Return the payload claims of a JWT.
+
+    JWTs use the URL-safe base64 alphabet with padding stripped, so restore
+    the padding and decode with urlsafe_b64decode.
+    """
+    payload_b64 = _payload(token)
+    payload_b64 += "=" * (-len(payload_b64) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload_b64))
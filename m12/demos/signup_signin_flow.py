@@ -1,12 +1,10 @@
-import json
-import time
-import base64
 from common import create_session, banner, step, success, fail, info, warn, kv, json_print, generate_name, track_resource
+from demos.jwt_claims import decode_claims
 
-def run(args):
+def run(args, cognito=None):
     banner("m12", "Cognito Sign-Up & Sign-In Flow")
-    session = create_session(args.profile, args.region)
-    cognito = session.client("cognito-idp")
+    if cognito is None:
+        cognito = create_session(args.profile, args.region).client("cognito-idp")
 
     # Step 1: Create User Pool
     step(1, "Creating Cognito User Pool")
@@ -91,11 +89,8 @@ def run(args):
 
     # Step 5: Decode the ID token (without verification, just to show claims)
     step(5, "Decoding JWT claims (ID Token)")
-    # Split token and decode payload (middle part)
-    payload_b64 = tokens["IdToken"].split(".")[1]
-    # Add padding
-    payload_b64 += "=" * (4 - len(payload_b64) % 4)
-    claims = json.loads(base64.b64decode(payload_b64))
+    # Decode the payload (middle part) from URL-safe base64
+    claims = decode_claims(tokens["IdToken"])
 
     info("Token claims:")
     for key in ["sub", "email", "email_verified", "iss", "aud", "token_use", "auth_time", "exp"]:
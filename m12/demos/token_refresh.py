@@ -1,9 +1,8 @@
-import json
 import time
-import base64
 from common import create_session, banner, step, success, info, kv, table, get_tracked_resources
+from demos.jwt_claims import decode_claims
 
-def run(args):
+def run(args, cognito=None):
     banner("m12", "Token Refresh Flow")
 
     # Check if we have a tracked user pool from the signup demo
@@ -15,8 +14,8 @@ def run(args):
         info("  python run.py --demo signup-signin")
         return
 
-    session = create_session(args.profile, args.region)
-    cognito = session.client("cognito-idp")
+    if cognito is None:
+        cognito = create_session(args.profile, args.region).client("cognito-idp")
     pool_id = pool_resources[-1]["id"]  # Use the most recent
 
     # Get the app client
@@ -40,9 +39,7 @@ def run(args):
 
     # Decode and show initial token expiry
     def decode_exp(token):
-        payload_b64 = token.split(".")[1]
-        payload_b64 += "=" * (4 - len(payload_b64) % 4)
-        claims = json.loads(base64.b64decode(payload_b64))
+        claims = decode_claims(token)
         return claims.get("exp"), claims.get("iat")
 
     old_exp, old_iat = decode_exp(tokens["IdToken"])
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import sys, pathlib
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
 
 from common.args import build_parser
@@ -26,7 +27,8 @@ def cleanup(args):
         return
     session = create_session(args.profile, args.region)
     cognito = session.client("cognito-idp")
-    for r in resources:
+
+    def _delete(r):
         if r["type"] == "cognito_user_pool":
             try:
                 # Delete all app clients first
@@ -41,6 +43,10 @@ def cleanup(args):
                 success(f"Deleted User Pool: {r['id']}")
             except Exception as e:
                 info(f"Could not delete {r['id']}: {e}")
+
+    # User pools are independent, so tear them down concurrently
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(_delete, resources))
     clear_tracked("m12")
 
 def main():
@@ -49,12 +55,14 @@ def main():
     if args.cleanup:
         cleanup(args)
         return
+    # One client for every demo in this run, so the service model loads once
+    cognito = create_session(args.profile, args.region).client("cognito-idp")
     if args.demo:
-        DEMOS[args.demo](args)
+        DEMOS[args.demo](args, cognito=cognito)
     else:
         banner("m12", "Cognito Auth")
         for fn in DEMOS.values():
-            fn(args)
+            fn(args, cognito=cognito)
         header("\nFastAPI App:")
         info("  Set env vars (shown during signup-signin demo) then:")
         info("  uvicorn m12.api.main:app --reload")
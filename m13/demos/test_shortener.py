@@ -1,7 +1,19 @@
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from common import create_session, banner, step, success, fail, info, kv, table as print_table
 
+# One keep-alive connection pool for every call to the API: after the first
+# request, the TCP and TLS handshakes are skipped. Only failed connects are
+# retried; GET /{code} records a click, so a sent request is never replayed.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, read=0, backoff_factor=0.2),
+))
+
 
 def run(args):
     banner("m13", "URL Shortener - Integration Test")
@@ -36,7 +48,7 @@ def run(args):
 
     # Step 2: Create a short URL
     step(2, "POST /shorten - Creating a short URL")
-    resp = requests.post(
+    resp = _SESSION.post(
         f"{api_url}/shorten",
         json={"url": "https://docs.aws.amazon.com/lambda/latest/dg/welcome.html", "ttl_hours": 1},
         timeout=30,
@@ -54,7 +66,7 @@ def run(args):
 
     # Step 3: Follow the redirect
     step(3, "GET /{code} - Following the redirect")
-    resp = requests.get(f"{api_url}/{code}", allow_redirects=False, timeout=30)
+    resp = _SESSION.get(f"{api_url}/{code}", allow_redirects=False, timeout=30)
     kv("Status", resp.status_code)
     kv("Location", resp.headers.get("Location", ""))
     if resp.status_code == 301:
@@ -65,13 +77,13 @@ def run(args):
     # Step 4: Click it a few more times
     step(4, "Clicking the short URL 3 more times")
     for i in range(3):
-        requests.get(f"{api_url}/{code}", allow_redirects=False, timeout=30)
+        _SESSION.get(f"{api_url}/{code}", allow_redirects=False, timeout=30)
         info(f"  Click {i + 2}")
     success("4 total clicks recorded")
 
     # Step 5: Check stats
     step(5, "GET /stats/{code} - Checking click statistics")
-    resp = requests.get(f"{api_url}/stats/{code}", timeout=30)
+    resp = _SESSION.get(f"{api_url}/stats/{code}", timeout=30)
     stats = resp.json()
     kv("Clicks", stats.get("clicks"))
     kv("Original URL", stats.get("original_url"))
@@ -83,11 +95,11 @@ def run(args):
     step(6, "Testing error cases")
 
     # Missing URL
-    resp = requests.post(f"{api_url}/shorten", json={}, timeout=30)
+    resp = _SESSION.post(f"{api_url}/shorten", json={}, timeout=30)
     kv("POST /shorten {} ->", f"{resp.status_code} {resp.json().get('error', '')}")
 
     # Invalid code
-    resp = requests.get(f"{api_url}/nonexistent123", allow_redirects=False, timeout=30)
+    resp = _SESSION.get(f"{api_url}/nonexistent123", allow_redirects=False, timeout=30)
     kv("GET /nonexistent123 ->", f"{resp.status_code}")
 
     success("Error handling verified")
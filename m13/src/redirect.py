@@ -2,37 +2,45 @@ from __future__ import annotations
 import json
 import os
 import boto3
+from botocore.config import Config
 
-ddb = boto3.client("dynamodb")
+ddb = boto3.client("dynamodb", config=Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"mode": "standard", "max_attempts": 3},
+))
 TABLE = os.environ["TABLE_NAME"]
+_RESERVED = frozenset({"shorten", "stats", "favicon.ico"})
+_JSON_HEADERS = {"content-type": "application/json"}
+_RESERVED_RESPONSE = {"statusCode": 404, "body": "not found"}
 
 
 def handler(event, context):
     code = event["pathParameters"]["code"]
 
     # Skip non-shortcode paths
-    if code in ("shorten", "stats", "favicon.ico"):
-        return {"statusCode": 404, "body": "not found"}
-
-    result = ddb.get_item(TableName=TABLE, Key={"code": {"S": code}})
-    item = result.get("Item")
-
-    if not item:
+    if code in _RESERVED:
+        return _RESERVED_RESPONSE
+
+    # Increment the click count and read the URL in one round trip; the
+    # condition keeps unknown codes from creating a new item.
+    try:
+        result = ddb.update_item(
+            TableName=TABLE,
+            Key={"code": {"S": code}},
+            UpdateExpression="SET clicks = if_not_exists(clicks, :zero) + :inc",
+            ConditionExpression="attribute_exists(code)",
+            ExpressionAttributeValues={":inc": {"N": "1"}, ":zero": {"N": "0"}},
+            ReturnValues="ALL_NEW",
+        )
+    except ddb.exceptions.ConditionalCheckFailedException:
         return {
             "statusCode": 404,
-            "headers": {"content-type": "application/json"},
+            "headers": _JSON_HEADERS,
             "body": json.dumps({"error": "Short URL not found", "code": code}),
         }
 
-    url = item["url"]["S"]
-
-    # Increment click count atomically
-    ddb.update_item(
-        TableName=TABLE,
-        Key={"code": {"S": code}},
-        UpdateExpression="SET clicks = clicks + :inc",
-        ExpressionAttributeValues={":inc": {"N": "1"}},
-    )
+    url = result["Attributes"]["url"]["S"]
 
     return {
         "statusCode": 301,
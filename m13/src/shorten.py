@@ -1,44 +1,60 @@
 from __future__ import annotations
 import json
 import os
-import string
-import random
+import secrets
 import time
 import boto3
+from botocore.config import Config
 
-ddb = boto3.client("dynamodb")
+ddb = boto3.client("dynamodb", config=Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"mode": "standard", "max_attempts": 3},
+))
 TABLE = os.environ["TABLE_NAME"]
-CHARS = string.ascii_letters + string.digits
+_JSON_HEADERS = {"content-type": "application/json"}
+MAX_ATTEMPTS = 5
 
 
 def generate_code(length=6):
-    return "".join(random.choices(CHARS, k=length))
+    # URL-safe alphabet from the OS CSPRNG, so codes aren't guessable
+    return secrets.token_urlsafe(length)[:length]
 
 
 def handler(event, context):
     try:
         body = json.loads(event.get("body") or "{}")
     except json.JSONDecodeError:
-        return response(400, {"error": "Invalid JSON"})
+        return _INVALID_JSON
 
     url = body.get("url")
     if not url or not url.startswith(("http://", "https://")):
-        return response(400, {"error": "Missing or invalid 'url' field. Must start with http:// or https://"})
+        return _INVALID_URL
 
     ttl_hours = body.get("ttl_hours", 24)
-    code = generate_code()
-    expires_at = int(time.time()) + (ttl_hours * 3600)
-
-    ddb.put_item(
-        TableName=TABLE,
-        Item={
-            "code": {"S": code},
-            "url": {"S": url},
-            "clicks": {"N": "0"},
-            "created_at": {"N": str(int(time.time()))},
-            "expires_at": {"N": str(expires_at)},
-        },
-    )
+    now = int(time.time())
+    expires_at = now + (ttl_hours * 3600)
+
+    # The condition rejects collisions server-side, so no read is needed first
+    for _ in range(MAX_ATTEMPTS):
+        code = generate_code()
+        try:
+            ddb.put_item(
+                TableName=TABLE,
+                Item={
+                    "code": {"S": code},
+                    "url": {"S": url},
+                    "clicks": {"N": "0"},
+                    "created_at": {"N": str(now)},
+                    "expires_at": {"N": str(expires_at)},
+                },
+                ConditionExpression="attribute_not_exists(code)",
+            )
+            break
+        except ddb.exceptions.ConditionalCheckFailedException:
+            continue
+    else:
+        return _NO_CODE
 
     api_url = f"https://{event['requestContext']['domainName']}/{event['requestContext']['stage']}"
     short_url = f"{api_url}/{code}"
@@ -54,6 +70,12 @@ def handler(event, context):
 def response(code, body):
     return {
         "statusCode": code,
-        "headers": {"content-type": "application/json"},
+        "headers": _JSON_HEADERS,
         "body": json.dumps(body),
     }
+
+
+# Static error responses are serialized once at import
+_INVALID_JSON = response(400, {"error": "Invalid JSON"})
+_INVALID_URL = response(400, {"error": "Missing or invalid 'url' field. Must start with http:// or https://"})
+_NO_CODE = response(500, {"error": "Could not allocate a unique short code"})
@@ -1,37 +1,76 @@
 from __future__ import annotations
 import json
 import os
-from datetime import datetime, timezone
+import time
 import boto3
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
 
-ddb = boto3.client("dynamodb")
+ddb = boto3.client("dynamodb", config=Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"mode": "standard", "max_attempts": 3},
+))
 TABLE = os.environ["TABLE_NAME"]
+_deserialize = TypeDeserializer().deserialize
+_JSON_HEADERS = {"content-type": "application/json"}
+_NOT_FOUND = {
+    "statusCode": 404,
+    "headers": _JSON_HEADERS,
+    "body": json.dumps({"error": "Short URL not found"}),
+}
+
+# Warm-container cache: code -> (valid_until, item). Clicks keep changing, so
+# entries live only a few seconds and never past the link's own expiry.
+CACHE_TTL = 5
+CACHE_MAX = 1024
+_CACHE = {}
 
 
 def handler(event, context):
     code = event["pathParameters"]["code"]
 
-    result = ddb.get_item(TableName=TABLE, Key={"code": {"S": code}})
-    item = result.get("Item")
+    item = get_item(code)
 
     if not item:
-        return {
-            "statusCode": 404,
-            "headers": {"content-type": "application/json"},
-            "body": json.dumps({"error": "Short URL not found"}),
-        }
+        return _NOT_FOUND
 
-    created_at = int(item.get("created_at", {}).get("N", "0"))
-    expires_at = int(item.get("expires_at", {}).get("N", "0"))
+    created_at = int(item.get("created_at", 0))
+    expires_at = int(item.get("expires_at", 0))
 
     return {
         "statusCode": 200,
-        "headers": {"content-type": "application/json"},
+        "headers": _JSON_HEADERS,
         "body": json.dumps({
             "code": code,
-            "original_url": item["url"]["S"],
-            "clicks": int(item["clicks"]["N"]),
-            "created_at": datetime.fromtimestamp(created_at, tz=timezone.utc).isoformat() if created_at else None,
-            "expires_at": datetime.fromtimestamp(expires_at, tz=timezone.utc).isoformat() if expires_at else None,
+            "original_url": item["url"],
+            "clicks": int(item["clicks"]),
+            "created_at": _iso(created_at) if created_at else None,
+            "expires_at": _iso(expires_at) if expires_at else None,
         }),
     }
+
+
+def _iso(epoch_seconds):
+    """Format whole epoch seconds like datetime.isoformat() on a UTC datetime."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(epoch_seconds))
+
+
+def get_item(code):
+    now = time.time()
+    entry = _CACHE.get(code)
+    if entry and entry[0] > now:
+        return entry[1]
+
+    item = ddb.get_item(TableName=TABLE, Key={"code": {"S": code}}).get("Item")
+    if item:
+        # Unmarshal once; cache hits reuse the plain Python values
+        item = {k: _deserialize(v) for k, v in item.items()}
+        valid_until = now + CACHE_TTL
+        expires_at = int(item.get("expires_at", 0))
+        if expires_at:
+            valid_until = min(valid_until, expires_at)
+        if len(_CACHE) >= CACHE_MAX and code not in _CACHE:
+            _CACHE.pop(next(iter(_CACHE)))  # evict the oldest entry (FIFO)
+        _CACHE[code] = (valid_until, item)
+    return item
@@ -4,6 +4,56 @@ from common import (
     generate_name, track_resource
 )
 
+# Static widget: built once at import rather than on every run
+_TEXT_WIDGET = {
+    "type": "text",
+    "x": 0, "y": 6, "width": 24, "height": 2,
+    "properties": {
+        "markdown": "## AWS Dev Demo Dashboard\nThis dashboard was created programmatically using the CloudWatch API."
+    },
+}
+
+
+def _dashboard_body(namespace, region, alarm_arns):
+    """Return the dashboard body JSON: latency, request count, banner, alarm status."""
+    widgets = [
+        {
+            "type": "metric",
+            "x": 0, "y": 0, "width": 12, "height": 6,
+            "properties": {
+                "title": "Request Latency",
+                "metrics": [
+                    [namespace, "RequestLatency", {"stat": "Average", "period": 60}],
+                    [namespace, "RequestLatency", {"stat": "p99", "period": 60}],
+                ],
+                "view": "timeSeries",
+                "region": region,
+            },
+        },
+        {
+            "type": "metric",
+            "x": 12, "y": 0, "width": 12, "height": 6,
+            "properties": {
+                "title": "Request Count",
+                "metrics": [
+                    [namespace, "RequestLatency", {"stat": "SampleCount", "period": 60}],
+                ],
+                "view": "timeSeries",
+                "region": region,
+            },
+        },
+        _TEXT_WIDGET,
+        {
+            "type": "alarm",
+            "x": 0, "y": 8, "width": 12, "height": 6,
+            "properties": {
+                "title": "Alarm Status",
+                "alarms": alarm_arns,
+            },
+        },
+    ]
+    return json.dumps({"widgets": widgets})
+
 
 def run(args):
     banner("m14", "CloudWatch Dashboard Builder")
@@ -16,51 +66,6 @@ def run(args):
     # Step 1: Define dashboard widgets
     step(1, "Defining dashboard layout")
 
-    dashboard_body = {
-        "widgets": [
-            {
-                "type": "metric",
-                "x": 0, "y": 0, "width": 12, "height": 6,
-                "properties": {
-                    "title": "Request Latency",
-                    "metrics": [
-                        [namespace, "RequestLatency", {"stat": "Average", "period": 60}],
-                        [namespace, "RequestLatency", {"stat": "p99", "period": 60}],
-                    ],
-                    "view": "timeSeries",
-                    "region": args.region,
-                },
-            },
-            {
-                "type": "metric",
-                "x": 12, "y": 0, "width": 12, "height": 6,
-                "properties": {
-                    "title": "Request Count",
-                    "metrics": [
-                        [namespace, "RequestLatency", {"stat": "SampleCount", "period": 60}],
-                    ],
-                    "view": "timeSeries",
-                    "region": args.region,
-                },
-            },
-            {
-                "type": "text",
-                "x": 0, "y": 6, "width": 24, "height": 2,
-                "properties": {
-                    "markdown": "## AWS Dev Demo Dashboard\nThis dashboard was created programmatically using the CloudWatch API."
-                },
-            },
-            {
-                "type": "alarm",
-                "x": 0, "y": 8, "width": 12, "height": 6,
-                "properties": {
-                    "title": "Alarm Status",
-                    "alarms": [],  # Will be populated if alarms exist
-                },
-            },
-        ],
-    }
-
     info("Layout:")
     info("  +------------+------------+")
     info("  | Latency    | Req Count  |")
@@ -72,18 +77,22 @@ def run(args):
     info("  +--------------------------+")
 
     # Check for existing alarms to add to dashboard
-    alarms = cw.describe_alarms(AlarmNamePrefix=args.prefix)["MetricAlarms"]
-    if alarms:
-        alarm_arns = [a["AlarmArn"] for a in alarms[:5]]
-        dashboard_body["widgets"][3]["properties"]["alarms"] = alarm_arns
-        info(f"\n  Found {len(alarms)} existing alarm(s) to include")
+    # The widget shows at most 5 alarms, so only ask CloudWatch for 5
+    alarms = cw.describe_alarms(
+        AlarmNamePrefix=args.prefix,
+        AlarmTypes=["MetricAlarm"],
+        MaxRecords=5,
+    )["MetricAlarms"]
+    alarm_arns = [a["AlarmArn"] for a in alarms]
+    if alarm_arns:
+        info(f"\n  Found {len(alarm_arns)} existing alarm(s) to include")
 
     # Step 2: Create the dashboard
     step(2, "Creating CloudWatch dashboard")
 
     cw.put_dashboard(
         DashboardName=dashboard_name,
-        DashboardBody=json.dumps(dashboard_body),
+        DashboardBody=_dashboard_body(namespace, args.region, alarm_arns),
     )
     track_resource("m14", "cloudwatch_dashboard", dashboard_name)
 
@@ -1,5 +1,6 @@
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from common import (
     create_session, banner, step, success, info, warn, kv,
@@ -46,15 +47,15 @@ def run(args):
     ]
 
     now = int(time.time() * 1000)
-    events = []
-    for i, entry in enumerate(log_entries):
-        events.append({
-            "timestamp": now + (i * 100),
-            "message": json.dumps(entry),
-        })
+    events = [
+        {"timestamp": now + (i * 100), "message": json.dumps(entry)}
+        for i, entry in enumerate(log_entries)
+    ]
+    for entry in log_entries:
         info(f"  [{entry['level']:5s}] {entry['service']:8s} | {entry['message']}")
 
-    logs.put_log_events(logGroupName=log_group, logStreamName=stream_name, logEvents=events)
+    for batch in _chunk_events(events):
+        logs.put_log_events(logGroupName=log_group, logStreamName=stream_name, logEvents=batch)
     success(f"Wrote {len(events)} log entries")
 
     # Step 3: Wait for logs to be queryable
@@ -69,24 +70,25 @@ def run(args):
         ("Slow requests (>100ms)", "filter latency_ms > 100 | fields message, service, latency_ms | sort latency_ms desc"),
     ]
 
-    for idx, (description, query) in enumerate(queries, start=4):
-        step(idx, f"Query: {description}")
-        info(f"  {query}\n")
-
-        start = logs.start_query(
+    # Start every query up front so CloudWatch runs them side by side,
+    # then wait on all of them concurrently
+    start_time = int((time.time() - 300) * 1000)
+    end_time = int((time.time() + 60) * 1000)
+    query_ids = [
+        logs.start_query(
             logGroupName=log_group,
-            startTime=int((time.time() - 300) * 1000),
-            endTime=int((time.time() + 60) * 1000),
+            startTime=start_time,
+            endTime=end_time,
             queryString=f"fields @timestamp, @message | parse @message '{{json_msg}}' | {query}",
-        )
-        query_id = start["queryId"]
+        )["queryId"]
+        for _, query in queries
+    ]
+    with ThreadPoolExecutor(max_workers=len(query_ids)) as pool:
+        query_results = list(pool.map(lambda qid: _wait_for_query(logs, qid), query_ids))
 
-        # Poll for results
-        for _ in range(10):
-            result = logs.get_query_results(queryId=query_id)
-            if result["status"] == "Complete":
-                break
-            time.sleep(1)
+    for idx, ((description, query), result) in enumerate(zip(queries, query_results), start=4):
+        step(idx, f"Query: {description}")
+        info(f"  {query}\n")
 
         results = result.get("results", [])
         if results:
@@ -99,3 +101,27 @@ def run(args):
             success(f"{len(results)} results")
         else:
             warn("No results (logs may need more time to index)")
+
+
+def _chunk_events(events, max_bytes=1_048_576, max_count=10_000):
+    """Yield PutLogEvents-sized batches (each event costs its UTF-8 size + 26 bytes)."""
+    batch, size = [], 0
+    for event in events:
+        event_size = len(event["message"].encode()) + 26
+        if batch and (size + event_size > max_bytes or len(batch) == max_count):
+            yield batch
+            batch, size = [], 0
+        batch.append(event)
+        size += event_size
+    if batch:
+        yield batch
+
+
+def _wait_for_query(logs, query_id, attempts=10):
+    """Poll a Logs Insights query until it completes (or attempts run out)."""
+    for _ in range(attempts):
+        result = logs.get_query_results(queryId=query_id)
+        if result["status"] == "Complete":
+            break
+        time.sleep(1)
+    return result
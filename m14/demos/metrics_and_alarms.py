@@ -20,24 +20,23 @@ def run(args):
     step(1, "Publishing custom metrics (simulated request latencies)")
 
     values = []
+    metric_data = []
     now = datetime.now(timezone.utc)
     for i in range(10):
         # Simulate increasing latency (gradual degradation)
         base = 50 + (i * 20)
         value = base + random.randint(-10, 10)
         values.append(value)
-
-        cw.put_metric_data(
-            Namespace=namespace,
-            MetricData=[{
-                "MetricName": metric_name,
-                "Timestamp": now - timedelta(minutes=10 - i),
-                "Value": float(value),
-                "Unit": "Milliseconds",
-            }]
-        )
+        metric_data.append({
+            "MetricName": metric_name,
+            "Timestamp": now - timedelta(minutes=10 - i),
+            "Value": float(value),
+            "Unit": "Milliseconds",
+        })
         info(f"  t-{10-i:02d}min: {value}ms")
 
+    # One PutMetricData call for all points (the API accepts up to 1000 per request)
+    cw.put_metric_data(Namespace=namespace, MetricData=metric_data)
     success(f"Published 10 data points to {namespace}/{metric_name}")
 
     # Step 2: Display an ASCII chart of the values
@@ -48,13 +47,8 @@ def run(args):
     print()
     for row in range(chart_height, 0, -1):
         threshold = (row / chart_height) * max_val
-        line = f"  {threshold:6.0f}ms |"
-        for v in values:
-            if v >= threshold:
-                line += " ##"
-            else:
-                line += "   "
-        print(line)
+        bars = "".join(" ##" if v >= threshold else "   " for v in values)
+        print(f"  {threshold:6.0f}ms |{bars}")
     print(f"         +{'---' * len(values)}")
     print(f"          " + "".join(f" {i:2d}" for i in range(len(values))))
     print(f"          (minutes ago, 0 = most recent)")
@@ -87,7 +81,10 @@ def run(args):
     step(4, "Checking alarm state")
     info("(Alarms take 1-2 minutes to evaluate. Showing current state.)")
 
-    alarm = cw.describe_alarms(AlarmNames=[alarm_name])["MetricAlarms"]
+    # One call, scoped to metric alarms and capped at the single record we need
+    alarm = cw.describe_alarms(
+        AlarmNames=[alarm_name], AlarmTypes=["MetricAlarm"], MaxRecords=1
+    )["MetricAlarms"]
     if alarm:
         state = alarm[0]["StateValue"]
         color = "\033[32m" if state == "OK" else "\033[31m" if state == "ALARM" else "\033[33m"
@@ -100,21 +97,36 @@ def run(args):
     end_time = datetime.now(timezone.utc)
     start_time = end_time - timedelta(minutes=15)
 
-    stats = cw.get_metric_statistics(
-        Namespace=namespace,
-        MetricName=metric_name,
+    # One GetMetricData request returns all three statistics
+    metric = {"Namespace": namespace, "MetricName": metric_name}
+    stats = ("Average", "Maximum", "Minimum")
+    resp = cw.get_metric_data(
+        MetricDataQueries=[
+            {
+                "Id": stat.lower(),
+                "MetricStat": {"Metric": metric, "Period": 300, "Stat": stat},
+                "ReturnData": True,
+            }
+            for stat in stats
+        ],
         StartTime=start_time,
         EndTime=end_time,
-        Period=300,
-        Statistics=["Average", "Maximum", "Minimum"],
+        ScanBy="TimestampAscending",
     )
 
-    datapoints = sorted(stats.get("Datapoints", []), key=lambda x: x["Timestamp"])
+    # Pivot per-statistic series into {timestamp: {stat: value}}; the series
+    # arrive oldest-first, so dict insertion order is already chronological
+    by_time = {}
+    for result in resp.get("MetricDataResults", []):
+        for ts, value in zip(result["Timestamps"], result["Values"]):
+            by_time.setdefault(ts, {})[result["Id"]] = value
+
+    datapoints = list(by_time.items())
     if datapoints:
-        for dp in datapoints:
+        for ts, dp in datapoints:
             kv(
-                f"  {dp['Timestamp'].strftime('%H:%M')}",
-                f"avg={dp.get('Average', 0):.0f}ms  max={dp.get('Maximum', 0):.0f}ms  min={dp.get('Minimum', 0):.0f}ms"
+                f"  {ts.strftime('%H:%M')}",
+                f"avg={dp.get('average', 0):.0f}ms  max={dp.get('maximum', 0):.0f}ms  min={dp.get('minimum', 0):.0f}ms"
             )
     else:
         info("  (Metrics may take a few minutes to appear in statistics)")
@@ -8,7 +8,12 @@ sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
 from common.args import build_parser
 from common.output import banner, info, header
 
-from demos.test_capstone import run as test_demo
+
+def test_demo(args):
+    # Imported on demand so --help and --cleanup don't load requests/botocore config
+    from demos.test_capstone import run
+    return run(args)
+
 
 DEMOS = {"test": test_demo}
 DEMO_INFO = {"test": "end-to-end integration test"}
@@ -16,6 +21,11 @@ DEMO_INFO = {"test": "end-to-end integration test"}
 
 def main():
     parser = build_parser("m15: End-to-End Capstone", DEMO_INFO)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached stack outputs and rediscover the deployed stack",
+    )
     args = parser.parse_args()
 
     if args.cleanup:
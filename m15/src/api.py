@@ -1,24 +1,55 @@
 from __future__ import annotations
 import os
 import json
+import base64
+import time
+from decimal import Decimal
 import boto3
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
-ddb = boto3.client("dynamodb")
+ddb = boto3.client("dynamodb", config=Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"mode": "standard", "max_attempts": 3},
+))
 TABLE = os.environ["TABLE_NAME"]
+DEFAULT_LIMIT = 25
+MAX_LIMIT = 100
+STATUS_INDEX = "status-index"
+BATCH_GET_LIMIT = 100  # BatchGetItem limit
+MAX_RETRIES = 5
+_HEADERS = {"content-type": "application/json"}
+_deserialize = TypeDeserializer().deserialize
 
 
-def handler(event, context):
-    method = event.get("httpMethod", "GET").upper()
-    path = event.get("path", "")
-    path_params = event.get("pathParameters") or {}
+def _json_default(o):
+    # Numbers come back as Decimal, string/number sets as set
+    if isinstance(o, Decimal):
+        return int(o) if o == o.to_integral_value() else float(o)
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    return str(o)
+
 
-    if method == "GET" and "id" in path_params:
-        return get_item(path_params["id"])
+_dumps = json.JSONEncoder(separators=(",", ":"), default=_json_default).encode
 
-    if method == "GET" and path.rstrip("/").endswith("/items"):
-        return list_items()
+# Open the connection during init so the first request doesn't pay for
+# credential resolution and the TCP/TLS handshake. DescribeTable is covered
+# by DynamoDBReadPolicy; a failure here only means no warm-up.
+try:
+    ddb.describe_table(TableName=TABLE)
+except (ClientError, BotoCoreError):
+    pass
 
-    return respond(404, {"error": "Not found"})
+
+def handler(event, context):
+    # API Gateway supplies the matched path template in "resource"
+    route = _ROUTES.get((event.get("httpMethod", "GET").upper(), event.get("resource", "")))
+    if route is None:
+        return respond(404, {"error": "Not found"})
+    return route(event)
 
 
 def get_item(item_id):
@@ -29,28 +60,108 @@ def get_item(item_id):
     return respond(200, unmarshal(item))
 
 
-def list_items():
-    result = ddb.scan(TableName=TABLE, Limit=50)
+def head_item(item_id):
+    """Status-only existence check: fetch just the key and send no body."""
+    result = ddb.get_item(TableName=TABLE, Key={"id": {"S": item_id}}, ProjectionExpression="id")
+    return {"statusCode": 200 if "Item" in result else 404, "headers": _HEADERS, "body": ""}
+
+
+def batch_get_items(body):
+    """Fetch up to 100 items by id with BatchGetItem, retrying unprocessed keys."""
+    try:
+        ids = json.loads(body or "{}").get("ids", [])
+    except (ValueError, AttributeError):
+        return respond(400, {"error": "Body must be a JSON object"})
+    if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+        return respond(400, {"error": "'ids' must be a list of strings"})
+
+    # BatchGetItem rejects duplicate keys
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > BATCH_GET_LIMIT:
+        return respond(400, {"error": f"At most {BATCH_GET_LIMIT} distinct ids per request"})
+    items = []
+    keys = [{"id": {"S": i}} for i in ids]
+    for attempt in range(MAX_RETRIES + 1):
+        if not keys:
+            break
+        resp = ddb.batch_get_item(RequestItems={TABLE: {"Keys": keys}})
+        items.extend(resp.get("Responses", {}).get(TABLE, []))
+        keys = resp.get("UnprocessedKeys", {}).get(TABLE, {}).get("Keys", [])
+        if keys and attempt < MAX_RETRIES:
+            time.sleep(0.05 * 2 ** attempt)  # exponential backoff on throttling
+
+    return respond(200, {
+        "items": [unmarshal(i) for i in items],
+        "count": len(items),
+        "unprocessed": [k["id"]["S"] for k in keys],
+    })
+
+
+def list_items(params):
+    """One page of item ids with ?status= (default "processed"), read from the status GSI.
+
+    Pass the returned "next" back as ?cursor= for the following page.
+    """
+    try:
+        limit = min(max(int(params.get("limit", DEFAULT_LIMIT)), 1), MAX_LIMIT)
+    except ValueError:
+        return respond(400, {"error": "limit must be an integer"})
+
+    kwargs = {
+        "TableName": TABLE,
+        "IndexName": STATUS_INDEX,
+        "KeyConditionExpression": "#s = :s",
+        "ProjectionExpression": "id, #s",  # covered by the KEYS_ONLY index
+        "ExpressionAttributeNames": {"#s": "status"},
+        "ExpressionAttributeValues": {":s": {"S": params.get("status", "processed")}},
+        "Limit": limit,
+    }
+    if params.get("cursor"):
+        try:
+            kwargs["ExclusiveStartKey"] = decode_cursor(params["cursor"])
+        except ValueError:
+            return respond(400, {"error": "Invalid cursor"})
+
+    result = ddb.query(**kwargs)
     items = [unmarshal(i) for i in result.get("Items", [])]
-    return respond(200, {"items": items, "count": len(items)})
+    last_key = result.get("LastEvaluatedKey")
+    return respond(200, {
+        "items": items,
+        "count": len(items),
+        "next": encode_cursor(last_key) if last_key else None,
+    })
+
+
+def encode_cursor(key):
+    return base64.urlsafe_b64encode(json.dumps(key, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor):
+    key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    # Must be exactly a status-index key, or Query raises ValidationException
+    if (not isinstance(key, dict) or key.keys() != {"id", "status"}
+            or not all(isinstance(v, dict) and v.keys() == {"S"} and isinstance(v["S"], str)
+                       for v in key.values())):
+        raise ValueError("cursor is not a key")
+    return key
 
 
 def unmarshal(item):
-    """Simple DynamoDB item unmarshaller."""
-    out = {}
-    for k, v in item.items():
-        if "S" in v:
-            out[k] = v["S"]
-        elif "N" in v:
-            out[k] = float(v["N"]) if "." in v["N"] else int(v["N"])
-        elif "BOOL" in v:
-            out[k] = v["BOOL"]
-    return out
+    """Convert a DynamoDB AttributeValue item to plain Python values."""
+    return {k: _deserialize(v) for k, v in item.items()}
 
 
 def respond(code, body):
     return {
         "statusCode": code,
-        "headers": {"content-type": "application/json"},
-        "body": json.dumps(body, default=str),
+        "headers": _HEADERS,
+        "body": _dumps(body),
     }
+
+
+_ROUTES = {
+    ("GET", "/items"): lambda e: list_items(e.get("queryStringParameters") or {}),
+    ("GET", "/items/{id}"): lambda e: get_item(e["pathParameters"]["id"]),
+    ("HEAD", "/items/{id}"): lambda e: head_item(e["pathParameters"]["id"]),
+    ("POST", "/items/batch"): lambda e: batch_get_items(e.get("body")),
+}
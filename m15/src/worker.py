@@ -2,11 +2,19 @@ from __future__ import annotations
 import os
 import json
 import logging
+import time
 from datetime import datetime, timezone
 import boto3
+from botocore.config import Config
 
-ddb = boto3.client("dynamodb")
+ddb = boto3.client("dynamodb", config=Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"mode": "standard", "max_attempts": 3},
+))
 TABLE = os.environ["TABLE_NAME"]
+BATCH_SIZE = 25  # BatchWriteItem limit
+MAX_RETRIES = 5
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -14,6 +22,9 @@ logger.setLevel(logging.INFO)
 
 def handler(event, context):
     results = {"processed": 0, "failed": 0}
+    items = {}  # id -> PutRequest item; last event for a key wins, as with put_item
+    received = 0
+    processed_at = datetime.now(timezone.utc).isoformat()  # one timestamp per batch
 
     for record in event.get("Records", []):
         try:
@@ -38,26 +49,15 @@ def handler(event, context):
                 key = s3_record.get("s3", {}).get("object", {}).get("key", "unknown")
                 size = s3_record.get("s3", {}).get("object", {}).get("size", 0)
 
-                ddb.put_item(
-                    TableName=TABLE,
-                    Item={
-                        "id": {"S": key},
-                        "bucket": {"S": bucket},
-                        "size": {"N": str(size)},
-                        "event": {"S": event_name},
-                        "status": {"S": "processed"},
-                        "processed_at": {"S": datetime.now(timezone.utc).isoformat()},
-                    },
-                )
-
-                logger.info(json.dumps({
-                    "event": "processed",
-                    "key": key,
-                    "bucket": bucket,
-                    "size": size,
-                    "event_name": event_name,
-                }))
-                results["processed"] += 1
+                items[key] = {
+                    "id": {"S": key},
+                    "bucket": {"S": bucket},
+                    "size": {"N": str(size)},
+                    "event": {"S": event_name},
+                    "status": {"S": "processed"},
+                    "processed_at": {"S": processed_at},
+                }
+                received += 1
 
         except Exception as e:
             results["failed"] += 1
@@ -69,5 +69,45 @@ def handler(event, context):
             }))
             raise  # Re-raise so SQS retries (and eventually DLQ)
 
+    try:
+        write_items(list(items.values()))
+    except Exception as e:
+        results["failed"] += received
+        logger.error(json.dumps({
+            "event": "processing_error",
+            "error": str(e),
+            "error_type": type(e).__name__,
+        }))
+        raise  # Re-raise so SQS retries (and eventually DLQ)
+
+    results["processed"] = received
+
     logger.info(json.dumps({"event": "batch_complete", **results}))
     return results
+
+
+def write_items(items):
+    """Write items with BatchWriteItem in chunks of 25, retrying unprocessed items.
+
+    Each item's "processed" log line is emitted as soon as its chunk commits.
+    """
+    for start in range(0, len(items), BATCH_SIZE):
+        chunk = items[start:start + BATCH_SIZE]
+        requests = [{"PutRequest": {"Item": i}} for i in chunk]
+        for attempt in range(MAX_RETRIES + 1):
+            resp = ddb.batch_write_item(RequestItems={TABLE: requests})
+            requests = resp.get("UnprocessedItems", {}).get(TABLE, [])
+            if not requests:
+                break
+            if attempt < MAX_RETRIES:
+                time.sleep(0.05 * 2 ** attempt)  # exponential backoff on throttling
+        else:
+            raise RuntimeError(f"{len(requests)} item(s) still unprocessed after {MAX_RETRIES} retries")
+        for item in chunk:
+            logger.info(json.dumps({
+                "event": "processed",
+                "key": item["id"]["S"],
+                "bucket": item["bucket"]["S"],
+                "size": int(item["size"]["N"]),
+                "event_name": item["event"]["S"],
+            }))
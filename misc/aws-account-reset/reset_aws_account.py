@@ -16,9 +16,11 @@ Usage:
 
 import boto3
 import argparse
+import queue
 import sys
-import time
-from botocore.exceptions import ClientError, EndpointConnectionError
+import threading
+from botocore.config import Config
+from botocore.exceptions import ClientError, EndpointConnectionError, WaiterError
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # IAM users to preserve (add more as needed)
@@ -31,25 +33,119 @@ REGIONS_TO_CLEAN = [
     "ap-southeast-1", "ap-southeast-2", "ap-northeast-1"
 ]
 
+# Service names accepted by --only / --skip
+SERVICES = (
+    "s3", "iam", "cloudformation", "lambda", "apigateway", "stepfunctions",
+    "sqs", "sns", "eventbridge", "dynamodb", "cognito", "secretsmanager",
+    "ecr", "cloudwatch", "ec2", "kms",
+)
+
+# Sized for the per-region and per-bucket thread pools; adaptive retries back
+# off on throttling instead of failing deletes, and keep-alive stops idle
+# pooled connections from being dropped between bursts
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+# IAM throttles at low request rates. Policies, roles, users and groups are
+# each deleted on an 8-thread pool, and the calls for one entity run on this
+# many threads inside it, so at most 8 x 2 IAM calls are in flight
+IAM_ENTITY_WORKERS = 2
+
+
+def _call(fn):
+    """Run a no-arg callable; lets _for_each fan out a list of prepared calls"""
+    return fn()
+
+
 class AWSAccountReset:
-    def __init__(self, dry_run=True):
+    def __init__(self, dry_run=True, services=SERVICES):
         self.dry_run = dry_run
+        self.services = set(services)  # excluded services are never even listed
         self.session = boto3.Session()
         self.deleted_resources = []
         self.errors = []
+        # Worker threads only enqueue log records; a single writer thread owns
+        # stdout and the two result lists, so logging never contends on a lock
+        self._log_queue = queue.Queue(maxsize=10_000)
+        self._writer = threading.Thread(target=self._drain_log, daemon=True)
+        self._writer.start()
+        # boto3.Session is not thread-safe: create clients one at a time
+        self._session_lock = threading.Lock()
+        self._clients = {}  # (service, region) -> client, shared by all threads
+        self._pending_terminations = {}  # region -> instance ids, awaited after all regions
         
     def log(self, message, level="INFO"):
-        prefix = "[DRY-RUN] " if self.dry_run else ""
-        print(f"{prefix}[{level}] {message}")
+        self._log_queue.put((level, message, None, None))
         
     def log_delete(self, resource_type, resource_id, region="global"):
         action = "Would delete" if self.dry_run else "Deleting"
-        self.log(f"{action}: {resource_type} - {resource_id} ({region})")
-        self.deleted_resources.append((resource_type, resource_id, region))
+        self._log_queue.put((
+            "INFO", f"{action}: {resource_type} - {resource_id} ({region})",
+            self.deleted_resources, (resource_type, resource_id, region),
+        ))
         
     def handle_error(self, resource_type, resource_id, error):
-        self.log(f"Error with {resource_type} {resource_id}: {error}", "ERROR")
-        self.errors.append((resource_type, resource_id, str(error)))
+        self._log_queue.put((
+            "ERROR", f"Error with {resource_type} {resource_id}: {error}",
+            self.errors, (resource_type, resource_id, str(error)),
+        ))
+
+    def _drain_log(self):
+        """Writer thread: print queued records in batches and record results"""
+        prefix = "[DRY-RUN] " if self.dry_run else ""
+        while True:
+            records = [self._log_queue.get()]
+            while len(records) < 500:
+                try:
+                    records.append(self._log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            for level, message, results, entry in records:
+                lines.append(f"{prefix}[{level}] {message}\n")
+                if results is not None:
+                    results.append(entry)
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+            for _ in records:
+                self._log_queue.task_done()
+
+    def flush_log(self):
+        """Block until every queued record has been written"""
+        self._log_queue.join()
+
+    def client(self, service, region=None):
+        """Return the cached boto3 client for (service, region), creating it once"""
+        key = (service, region)
+        with self._session_lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = self.session.client(
+                    service, region_name=region, config=CLIENT_CONFIG
+                )
+            return client
+
+    @staticmethod
+    def _all(client, operation, key, **kwargs):
+        """Return the full list under `key`, merged across all pages of a paginated call"""
+        return client.get_paginator(operation).paginate(**kwargs).build_full_result().get(key, [])
+
+    @staticmethod
+    def _for_each(func, items, max_workers=8):
+        """Apply func to every item on a bounded thread pool (deletes are independent I/O).
+
+        Returns the results in item order and re-raises the first failure.
+        Pass _call as func to run a list of no-arg callables.
+        """
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
 
     # =========================================================================
     # S3 Cleanup
@@ -57,48 +153,57 @@ class AWSAccountReset:
     def delete_s3_buckets(self):
         """Delete all S3 buckets and their contents"""
         self.log("=== Cleaning S3 Buckets ===")
-        s3 = self.session.client("s3")
-        s3_resource = self.session.resource("s3")
-        
+        s3 = self.client("s3")
+        s3_resource = None
+        if not self.dry_run:
+            # Loading the resource model is costly and only deletes need it
+            with self._session_lock:
+                s3_resource = self.session.resource("s3", config=CLIENT_CONFIG)
+
         try:
             buckets = s3.list_buckets().get("Buckets", [])
         except ClientError as e:
             self.handle_error("S3", "list_buckets", e)
             return
             
-        for bucket in buckets:
-            bucket_name = bucket["Name"]
+        def empty_and_delete(bucket_name):
             try:
                 self.log_delete("S3 Bucket", bucket_name)
                 if not self.dry_run:
-                    # Delete all versions (for versioned buckets)
-                    bucket_obj = s3_resource.Bucket(bucket_name)
-                    bucket_obj.object_versions.delete()
-                    bucket_obj.objects.delete()
+                    # The collection action lists versions and delete markers and
+                    # sends 1000-key DeleteObjects batches; an empty bucket costs
+                    # it a single list call
+                    s3_resource.Bucket(bucket_name).object_versions.delete()
                     s3.delete_bucket(Bucket=bucket_name)
             except ClientError as e:
                 self.handle_error("S3 Bucket", bucket_name, e)
 
+        # Buckets are independent: empty and delete them concurrently. The one
+        # client and resource are shared, so all threads use the same HTTP pool.
+        self._for_each(empty_and_delete, [b["Name"] for b in buckets], max_workers=32)
+
     # =========================================================================
     # DynamoDB Cleanup
     # =========================================================================
     def delete_dynamodb_tables(self, region):
         """Delete all DynamoDB tables in a region"""
         self.log(f"=== Cleaning DynamoDB Tables ({region}) ===")
-        dynamodb = self.session.client("dynamodb", region_name=region)
-        
+        dynamodb = self.client("dynamodb", region)
+
+        def delete(table_name):
+            try:
+                self.log_delete("DynamoDB Table", table_name, region)
+                if not self.dry_run:
+                    dynamodb.delete_table(TableName=table_name)
+            except ClientError as e:
+                self.handle_error("DynamoDB Table", table_name, e)
+
         try:
-            paginator = dynamodb.get_paginator("list_tables")
-            for page in paginator.paginate():
-                for table_name in page.get("TableNames", []):
-                    try:
-                        self.log_delete("DynamoDB Table", table_name, region)
-                        if not self.dry_run:
-                            dynamodb.delete_table(TableName=table_name)
-                    except ClientError as e:
-                        self.handle_error("DynamoDB Table", table_name, e)
+            table_names = self._all(dynamodb, "list_tables", "TableNames")
         except ClientError as e:
             self.handle_error("DynamoDB", f"list_tables ({region})", e)
+            return
+        self._for_each(delete, table_names)
 
     # =========================================================================
     # Lambda Cleanup
@@ -106,21 +211,22 @@ class AWSAccountReset:
     def delete_lambda_functions(self, region):
         """Delete all Lambda functions in a region"""
         self.log(f"=== Cleaning Lambda Functions ({region}) ===")
-        lambda_client = self.session.client("lambda", region_name=region)
-        
+        lambda_client = self.client("lambda", region)
+
+        def delete(func_name):
+            try:
+                self.log_delete("Lambda Function", func_name, region)
+                if not self.dry_run:
+                    lambda_client.delete_function(FunctionName=func_name)
+            except ClientError as e:
+                self.handle_error("Lambda Function", func_name, e)
+
         try:
-            paginator = lambda_client.get_paginator("list_functions")
-            for page in paginator.paginate():
-                for func in page.get("Functions", []):
-                    func_name = func["FunctionName"]
-                    try:
-                        self.log_delete("Lambda Function", func_name, region)
-                        if not self.dry_run:
-                            lambda_client.delete_function(FunctionName=func_name)
-                    except ClientError as e:
-                        self.handle_error("Lambda Function", func_name, e)
+            func_names = [f["FunctionName"] for f in self._all(lambda_client, "list_functions", "Functions")]
         except ClientError as e:
             self.handle_error("Lambda", f"list_functions ({region})", e)
+            return
+        self._for_each(delete, func_names)
 
     # =========================================================================
     # API Gateway Cleanup
@@ -128,11 +234,13 @@ class AWSAccountReset:
     def delete_api_gateways(self, region):
         """Delete all API Gateway REST APIs and HTTP APIs"""
         self.log(f"=== Cleaning API Gateway ({region}) ===")
-        
-        # REST APIs
-        apigw = self.session.client("apigateway", region_name=region)
+        # REST and HTTP APIs are separate services
+        self._for_each(lambda delete: delete(region), [self._delete_rest_apis, self._delete_http_apis])
+
+    def _delete_rest_apis(self, region):
+        apigw = self.client("apigateway", region)
         try:
-            apis = apigw.get_rest_apis().get("items", [])
+            apis = self._all(apigw, "get_rest_apis", "items")
             for api in apis:
                 api_id = api["id"]
                 api_name = api.get("name", api_id)
@@ -144,11 +252,11 @@ class AWSAccountReset:
                     self.handle_error("API Gateway REST API", api_id, e)
         except ClientError as e:
             self.handle_error("API Gateway", f"get_rest_apis ({region})", e)
-            
-        # HTTP APIs (API Gateway v2)
-        apigwv2 = self.session.client("apigatewayv2", region_name=region)
+
+    def _delete_http_apis(self, region):
+        apigwv2 = self.client("apigatewayv2", region)
         try:
-            apis = apigwv2.get_apis().get("Items", [])
+            apis = self._all(apigwv2, "get_apis", "Items")
             for api in apis:
                 api_id = api["ApiId"]
                 api_name = api.get("Name", api_id)
@@ -167,19 +275,22 @@ class AWSAccountReset:
     def delete_sqs_queues(self, region):
         """Delete all SQS queues in a region"""
         self.log(f"=== Cleaning SQS Queues ({region}) ===")
-        sqs = self.session.client("sqs", region_name=region)
-        
+        sqs = self.client("sqs", region)
+
+        def delete(queue_url):
+            try:
+                self.log_delete("SQS Queue", queue_url, region)
+                if not self.dry_run:
+                    sqs.delete_queue(QueueUrl=queue_url)
+            except ClientError as e:
+                self.handle_error("SQS Queue", queue_url, e)
+
         try:
-            queues = sqs.list_queues().get("QueueUrls", [])
-            for queue_url in queues:
-                try:
-                    self.log_delete("SQS Queue", queue_url, region)
-                    if not self.dry_run:
-                        sqs.delete_queue(QueueUrl=queue_url)
-                except ClientError as e:
-                    self.handle_error("SQS Queue", queue_url, e)
+            queue_urls = self._all(sqs, "list_queues", "QueueUrls", PaginationConfig={"PageSize": 1000})
         except ClientError as e:
             self.handle_error("SQS", f"list_queues ({region})", e)
+            return
+        self._for_each(delete, queue_urls)
 
     # =========================================================================
     # SNS Cleanup
@@ -187,21 +298,22 @@ class AWSAccountReset:
     def delete_sns_topics(self, region):
         """Delete all SNS topics in a region"""
         self.log(f"=== Cleaning SNS Topics ({region}) ===")
-        sns = self.session.client("sns", region_name=region)
-        
+        sns = self.client("sns", region)
+
+        def delete(topic_arn):
+            try:
+                self.log_delete("SNS Topic", topic_arn, region)
+                if not self.dry_run:
+                    sns.delete_topic(TopicArn=topic_arn)
+            except ClientError as e:
+                self.handle_error("SNS Topic", topic_arn, e)
+
         try:
-            paginator = sns.get_paginator("list_topics")
-            for page in paginator.paginate():
-                for topic in page.get("Topics", []):
-                    topic_arn = topic["TopicArn"]
-                    try:
-                        self.log_delete("SNS Topic", topic_arn, region)
-                        if not self.dry_run:
-                            sns.delete_topic(TopicArn=topic_arn)
-                    except ClientError as e:
-                        self.handle_error("SNS Topic", topic_arn, e)
+            topic_arns = [t["TopicArn"] for t in self._all(sns, "list_topics", "Topics")]
         except ClientError as e:
             self.handle_error("SNS", f"list_topics ({region})", e)
+            return
+        self._for_each(delete, topic_arns)
 
     # =========================================================================
     # EventBridge Cleanup
@@ -209,52 +321,57 @@ class AWSAccountReset:
     def delete_eventbridge_rules(self, region):
         """Delete all EventBridge rules in a region"""
         self.log(f"=== Cleaning EventBridge Rules ({region}) ===")
-        events = self.session.client("events", region_name=region)
-        
+        events = self.client("events", region)
+
+        def purge_rule(bus_and_rule):
+            bus_name, rule_name = bus_and_rule
+            try:
+                self.log_delete("EventBridge Rule", f"{rule_name} ({bus_name})", region)
+                if not self.dry_run:
+                    # Remove targets first; RemoveTargets takes up to 100 ids per call
+                    target_ids = [
+                        t["Id"] for t in self._all(
+                            events, "list_targets_by_rule", "Targets",
+                            Rule=rule_name, EventBusName=bus_name,
+                        )
+                    ]
+                    for i in range(0, len(target_ids), 100):
+                        events.remove_targets(
+                            Rule=rule_name,
+                            EventBusName=bus_name,
+                            Ids=target_ids[i:i + 100]
+                        )
+                    events.delete_rule(Name=rule_name, EventBusName=bus_name)
+            except ClientError as e:
+                self.handle_error("EventBridge Rule", rule_name, e)
+
+        def delete_bus(bus_name):
+            try:
+                self.log_delete("EventBridge Bus", bus_name, region)
+                if not self.dry_run:
+                    events.delete_event_bus(Name=bus_name)
+            except ClientError as e:
+                self.handle_error("EventBridge Bus", bus_name, e)
+
         try:
-            # Get all event buses first
-            buses = events.list_event_buses().get("EventBuses", [])
-            for bus in buses:
-                bus_name = bus["Name"]
-                
-                # List rules on this bus
-                paginator = events.get_paginator("list_rules")
-                for page in paginator.paginate(EventBusName=bus_name):
-                    for rule in page.get("Rules", []):
-                        rule_name = rule["Name"]
-                        # Skip AWS managed rules
-                        if rule.get("ManagedBy"):
-                            continue
-                        try:
-                            # Remove targets first
-                            targets = events.list_targets_by_rule(
-                                Rule=rule_name, EventBusName=bus_name
-                            ).get("Targets", [])
-                            if targets and not self.dry_run:
-                                target_ids = [t["Id"] for t in targets]
-                                events.remove_targets(
-                                    Rule=rule_name, 
-                                    EventBusName=bus_name, 
-                                    Ids=target_ids
-                                )
-                            
-                            self.log_delete("EventBridge Rule", f"{rule_name} ({bus_name})", region)
-                            if not self.dry_run:
-                                events.delete_rule(Name=rule_name, EventBusName=bus_name)
-                        except ClientError as e:
-                            self.handle_error("EventBridge Rule", rule_name, e)
-                            
-                # Delete custom event buses (not default)
-                if bus_name != "default" and not bus_name.startswith("aws."):
-                    try:
-                        self.log_delete("EventBridge Bus", bus_name, region)
-                        if not self.dry_run:
-                            events.delete_event_bus(Name=bus_name)
-                    except ClientError as e:
-                        self.handle_error("EventBridge Bus", bus_name, e)
-                        
+            # Get all event buses first, then every rule on them
+            bus_names = [bus["Name"] for bus in events.list_event_buses().get("EventBuses", [])]
+            rules = [
+                (bus_name, rule["Name"])
+                for bus_name in bus_names
+                for rule in self._all(events, "list_rules", "Rules", EventBusName=bus_name)
+                if not rule.get("ManagedBy")  # Skip AWS managed rules
+            ]
         except ClientError as e:
             self.handle_error("EventBridge", f"list_rules ({region})", e)
+            return
+
+        # Rules are independent of each other; a bus can go once its rules are gone
+        self._for_each(purge_rule, rules, max_workers=16)
+        # Delete custom event buses (not default)
+        self._for_each(delete_bus, [
+            b for b in bus_names if b != "default" and not b.startswith("aws.")
+        ])
 
     # =========================================================================
     # CloudWatch Cleanup
@@ -262,52 +379,71 @@ class AWSAccountReset:
     def delete_cloudwatch_resources(self, region):
         """Delete CloudWatch alarms, dashboards, and log groups"""
         self.log(f"=== Cleaning CloudWatch ({region}) ===")
-        cw = self.session.client("cloudwatch", region_name=region)
-        logs = self.session.client("logs", region_name=region)
-        
-        # Alarms
+        cw = self.client("cloudwatch", region)
+        logs = self.client("logs", region)
+        self._for_each(_call, [
+            lambda: self._delete_alarms(cw, region),
+            lambda: self._delete_dashboards(cw, region),
+            lambda: self._delete_log_groups(logs, region),
+        ])
+
+    def _delete_alarms(self, cw, region):
         try:
+            names = []
             paginator = cw.get_paginator("describe_alarms")
             for page in paginator.paginate():
                 for alarm in page.get("MetricAlarms", []):
-                    alarm_name = alarm["AlarmName"]
-                    try:
-                        self.log_delete("CloudWatch Alarm", alarm_name, region)
-                        if not self.dry_run:
-                            cw.delete_alarms(AlarmNames=[alarm_name])
-                    except ClientError as e:
-                        self.handle_error("CloudWatch Alarm", alarm_name, e)
+                    self.log_delete("CloudWatch Alarm", alarm["AlarmName"], region)
+                    names.append(alarm["AlarmName"])
         except ClientError as e:
             self.handle_error("CloudWatch", f"describe_alarms ({region})", e)
-            
-        # Dashboards
-        try:
-            dashboards = cw.list_dashboards().get("DashboardEntries", [])
-            for dashboard in dashboards:
-                name = dashboard["DashboardName"]
+            return
+        if not self.dry_run:
+            # DeleteAlarms takes up to 100 names per request
+            for i in range(0, len(names), 100):
+                chunk = names[i:i + 100]
                 try:
-                    self.log_delete("CloudWatch Dashboard", name, region)
-                    if not self.dry_run:
-                        cw.delete_dashboards(DashboardNames=[name])
+                    cw.delete_alarms(AlarmNames=chunk)
                 except ClientError as e:
-                    self.handle_error("CloudWatch Dashboard", name, e)
+                    self.handle_error("CloudWatch Alarms", ", ".join(chunk), e)
+
+    def _delete_dashboards(self, cw, region):
+        try:
+            names = [d["DashboardName"] for d in self._all(cw, "list_dashboards", "DashboardEntries")]
         except ClientError as e:
             self.handle_error("CloudWatch", f"list_dashboards ({region})", e)
-            
-        # Log Groups
+            return
+        for name in names:
+            self.log_delete("CloudWatch Dashboard", name, region)
+        if not self.dry_run:
+            # DeleteDashboards takes a list of names; send them 100 at a time
+            for i in range(0, len(names), 100):
+                chunk = names[i:i + 100]
+                try:
+                    cw.delete_dashboards(DashboardNames=chunk)
+                except ClientError as e:
+                    self.handle_error("CloudWatch Dashboards", ", ".join(chunk), e)
+
+    def _delete_log_groups(self, logs, region):
+        def delete(lg_name):
+            try:
+                logs.delete_log_group(logGroupName=lg_name)
+            except ClientError as e:
+                self.handle_error("CloudWatch Log Group", lg_name, e)
+
         try:
+            names = []
             paginator = logs.get_paginator("describe_log_groups")
             for page in paginator.paginate():
                 for lg in page.get("logGroups", []):
-                    lg_name = lg["logGroupName"]
-                    try:
-                        self.log_delete("CloudWatch Log Group", lg_name, region)
-                        if not self.dry_run:
-                            logs.delete_log_group(logGroupName=lg_name)
-                    except ClientError as e:
-                        self.handle_error("CloudWatch Log Group", lg_name, e)
+                    self.log_delete("CloudWatch Log Group", lg["logGroupName"], region)
+                    names.append(lg["logGroupName"])
         except ClientError as e:
             self.handle_error("CloudWatch Logs", f"describe_log_groups ({region})", e)
+            return
+        if not self.dry_run:
+            # There is no batch delete for log groups; overlap the calls instead
+            self._for_each(delete, names)
 
     # =========================================================================
     # Cognito Cleanup
@@ -316,49 +452,63 @@ class AWSAccountReset:
         """Delete Cognito User Pools and Identity Pools"""
         self.log(f"=== Cleaning Cognito ({region}) ===")
         
-        # User Pools
-        cognito_idp = self.session.client("cognito-idp", region_name=region)
-        try:
-            paginator = cognito_idp.get_paginator("list_user_pools")
-            for page in paginator.paginate(MaxResults=60):
-                for pool in page.get("UserPools", []):
-                    pool_id = pool["Id"]
-                    pool_name = pool.get("Name", pool_id)
-                    try:
-                        # Delete domain first if exists
-                        try:
-                            pool_desc = cognito_idp.describe_user_pool(UserPoolId=pool_id)
-                            domain = pool_desc.get("UserPool", {}).get("Domain")
-                            if domain and not self.dry_run:
-                                cognito_idp.delete_user_pool_domain(
-                                    Domain=domain, UserPoolId=pool_id
-                                )
-                        except ClientError:
-                            pass
-                            
-                        self.log_delete("Cognito User Pool", f"{pool_name} ({pool_id})", region)
-                        if not self.dry_run:
-                            cognito_idp.delete_user_pool(UserPoolId=pool_id)
-                    except ClientError as e:
-                        self.handle_error("Cognito User Pool", pool_id, e)
+        self._delete_user_pools(region)
+        self._delete_identity_pools(region)
+
+    def _delete_user_pools(self, region):
+        cognito_idp = self.client("cognito-idp", region)
+
+        def delete(pool):
+            pool_id = pool["Id"]
+            pool_name = pool.get("Name", pool_id)
+            try:
+                self.log_delete("Cognito User Pool", f"{pool_name} ({pool_id})", region)
+                if not self.dry_run:
+                    self._purge_user_pool(cognito_idp, pool_id)
+            except ClientError as e:
+                self.handle_error("Cognito User Pool", pool_id, e)
+
+        try:
+            pools = self._all(cognito_idp, "list_user_pools", "UserPools", MaxResults=60)
         except ClientError as e:
             self.handle_error("Cognito", f"list_user_pools ({region})", e)
-            
-        # Identity Pools
-        cognito_identity = self.session.client("cognito-identity", region_name=region)
+            return
+        self._for_each(delete, pools)
+
+    @staticmethod
+    def _purge_user_pool(cognito_idp, pool_id):
+        # Most pools have no domain, so try the delete first and only look the
+        # domain up when Cognito refuses because one is still configured
         try:
-            pools = cognito_identity.list_identity_pools(MaxResults=60).get("IdentityPools", [])
-            for pool in pools:
-                pool_id = pool["IdentityPoolId"]
-                pool_name = pool.get("IdentityPoolName", pool_id)
-                try:
-                    self.log_delete("Cognito Identity Pool", f"{pool_name} ({pool_id})", region)
-                    if not self.dry_run:
-                        cognito_identity.delete_identity_pool(IdentityPoolId=pool_id)
-                except ClientError as e:
-                    self.handle_error("Cognito Identity Pool", pool_id, e)
+            cognito_idp.delete_user_pool(UserPoolId=pool_id)
+            return
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ("InvalidParameterException", "ResourceConflictException"):
+                raise
+        domain = cognito_idp.describe_user_pool(UserPoolId=pool_id).get("UserPool", {}).get("Domain")
+        if domain:
+            cognito_idp.delete_user_pool_domain(Domain=domain, UserPoolId=pool_id)
+        cognito_idp.delete_user_pool(UserPoolId=pool_id)
+
+    def _delete_identity_pools(self, region):
+        cognito_identity = self.client("cognito-identity", region)
+
+        def delete(pool):
+            pool_id = pool["IdentityPoolId"]
+            pool_name = pool.get("IdentityPoolName", pool_id)
+            try:
+                self.log_delete("Cognito Identity Pool", f"{pool_name} ({pool_id})", region)
+                if not self.dry_run:
+                    cognito_identity.delete_identity_pool(IdentityPoolId=pool_id)
+            except ClientError as e:
+                self.handle_error("Cognito Identity Pool", pool_id, e)
+
+        try:
+            pools = self._all(cognito_identity, "list_identity_pools", "IdentityPools", MaxResults=60)
         except ClientError as e:
             self.handle_error("Cognito Identity", f"list_identity_pools ({region})", e)
+            return
+        self._for_each(delete, pools)
 
     # =========================================================================
     # EC2 Cleanup
@@ -366,15 +516,53 @@ class AWSAccountReset:
     def delete_ec2_resources(self, region):
         """Delete EC2 instances, security groups, key pairs, etc."""
         self.log(f"=== Cleaning EC2 ({region}) ===")
-        ec2 = self.session.client("ec2", region_name=region)
-        
-        # Terminate instances
+        ec2 = self.client("ec2", region)
+
+        # Instances go first: their security groups, volumes and addresses
+        # can't be removed while attached. The rest are independent.
+        if self._ec2_instances(ec2, region):
+            # Don't hold the region on the termination waiter; the attached
+            # resources are removed in finish_ec2_terminations()
+            self._for_each(lambda step: step(ec2, region), [self._ec2_key_pairs, self._ec2_snapshots])
+            return
+        self._for_each(lambda step: step(ec2, region), [
+            self._ec2_key_pairs,
+            self._ec2_security_groups,
+            self._ec2_volumes,
+            self._ec2_snapshots,
+            self._ec2_addresses,
+        ])
+
+    def finish_ec2_terminations(self):
+        """Wait for deferred instance terminations, then delete what was attached to them"""
+        def finish(region):
+            ec2 = self.client("ec2", region)
+            try:
+                ec2.get_waiter("instance_terminated").wait(
+                    InstanceIds=self._pending_terminations[region],
+                    WaiterConfig={"Delay": 5, "MaxAttempts": 120},
+                )
+            except WaiterError as e:
+                self.handle_error("EC2 Instances", f"wait ({region})", e)
+            self._for_each(lambda step: step(ec2, region), [
+                self._ec2_security_groups,
+                self._ec2_volumes,
+                self._ec2_addresses,
+            ])
+
+        if self._pending_terminations:
+            self.log(f"=== Waiting for EC2 terminations ({', '.join(self._pending_terminations)}) ===")
+            self._for_each(finish, list(self._pending_terminations), max_workers=len(self._pending_terminations))
+
+    def _ec2_instances(self, ec2, region):
+        """Terminate instances; returns True if terminations are pending"""
         try:
-            instances = ec2.describe_instances(
-                Filters=[{"Name": "instance-state-name", "Values": ["running", "stopped", "pending"]}]
+            reservations = self._all(
+                ec2, "describe_instances", "Reservations",
+                Filters=[{"Name": "instance-state-name", "Values": ["running", "stopped", "pending"]}],
             )
             instance_ids = []
-            for reservation in instances.get("Reservations", []):
+            for reservation in reservations:
                 for instance in reservation.get("Instances", []):
                     instance_ids.append(instance["InstanceId"])
                     
@@ -382,12 +570,13 @@ class AWSAccountReset:
                 self.log_delete("EC2 Instances", str(instance_ids), region)
                 if not self.dry_run:
                     ec2.terminate_instances(InstanceIds=instance_ids)
-                    # Wait for termination
-                    waiter = ec2.get_waiter("instance_terminated")
-                    waiter.wait(InstanceIds=instance_ids)
+                    self._pending_terminations[region] = instance_ids  # one key per region thread
+                    return True
         except ClientError as e:
             self.handle_error("EC2 Instances", "terminate", e)
-            
+        return False
+
+    def _ec2_key_pairs(self, ec2, region):
         # Delete key pairs
         try:
             key_pairs = ec2.describe_key_pairs().get("KeyPairs", [])
@@ -401,10 +590,11 @@ class AWSAccountReset:
                     self.handle_error("EC2 Key Pair", kp_name, e)
         except ClientError as e:
             self.handle_error("EC2", f"describe_key_pairs ({region})", e)
-            
+
+    def _ec2_security_groups(self, ec2, region):
         # Delete custom security groups (not default)
         try:
-            sgs = ec2.describe_security_groups().get("SecurityGroups", [])
+            sgs = self._all(ec2, "describe_security_groups", "SecurityGroups")
             for sg in sgs:
                 if sg["GroupName"] == "default":
                     continue
@@ -417,12 +607,14 @@ class AWSAccountReset:
                     self.handle_error("EC2 Security Group", sg_id, e)
         except ClientError as e:
             self.handle_error("EC2", f"describe_security_groups ({region})", e)
-            
+
+    def _ec2_volumes(self, ec2, region):
         # Delete EBS volumes (unattached)
         try:
-            volumes = ec2.describe_volumes(
-                Filters=[{"Name": "status", "Values": ["available"]}]
-            ).get("Volumes", [])
+            volumes = self._all(
+                ec2, "describe_volumes", "Volumes",
+                Filters=[{"Name": "status", "Values": ["available"]}],
+            )
             for vol in volumes:
                 vol_id = vol["VolumeId"]
                 try:
@@ -433,22 +625,30 @@ class AWSAccountReset:
                     self.handle_error("EBS Volume", vol_id, e)
         except ClientError as e:
             self.handle_error("EC2", f"describe_volumes ({region})", e)
-            
-        # Delete snapshots owned by this account
+
+    def _ec2_snapshots(self, ec2, region):
+        def delete(snap_id):
+            try:
+                self.log_delete("EBS Snapshot", snap_id, region)
+                if not self.dry_run:
+                    ec2.delete_snapshot(SnapshotId=snap_id)
+            except ClientError as e:
+                self.handle_error("EBS Snapshot", snap_id, e)
+
+        # Delete snapshots owned by this account ("self" needs no account id lookup)
         try:
-            account_id = self.session.client("sts").get_caller_identity()["Account"]
-            snapshots = ec2.describe_snapshots(OwnerIds=[account_id]).get("Snapshots", [])
-            for snap in snapshots:
-                snap_id = snap["SnapshotId"]
-                try:
-                    self.log_delete("EBS Snapshot", snap_id, region)
-                    if not self.dry_run:
-                        ec2.delete_snapshot(SnapshotId=snap_id)
-                except ClientError as e:
-                    self.handle_error("EBS Snapshot", snap_id, e)
+            snap_ids = [
+                snap["SnapshotId"] for snap in self._all(
+                    ec2, "describe_snapshots", "Snapshots",
+                    OwnerIds=["self"], PaginationConfig={"PageSize": 1000},
+                )
+            ]
         except ClientError as e:
             self.handle_error("EC2", f"describe_snapshots ({region})", e)
-            
+            return
+        self._for_each(delete, snap_ids)
+
+    def _ec2_addresses(self, ec2, region):
         # Delete Elastic IPs
         try:
             eips = ec2.describe_addresses().get("Addresses", [])
@@ -470,189 +670,222 @@ class AWSAccountReset:
     def delete_iam_resources(self):
         """Delete IAM users, roles, policies (preserving AWS-managed and specified users)"""
         self.log("=== Cleaning IAM Resources (Global) ===")
-        iam = self.session.client("iam")
-        
-        # Delete custom policies
+        iam = self.client("iam")
+
+        # Categories stay in dependency order; items within one are deleted in parallel
+        self._iam_policies(iam)
+        self._iam_roles(iam)
+        self._iam_instance_profiles(iam)
+        self._iam_users(iam)
+        self._iam_groups(iam)
+
+    def _iam_policies(self, iam):
+        def delete(policy):
+            policy_name = policy["PolicyName"]
+            try:
+                self.log_delete("IAM Policy", policy_name)
+                if not self.dry_run:
+                    self._purge_policy(iam, policy)
+            except ClientError as e:
+                self.handle_error("IAM Policy", policy_name, e)
+
         try:
-            paginator = iam.get_paginator("list_policies")
-            for page in paginator.paginate(Scope="Local"):  # Only customer-managed
-                for policy in page.get("Policies", []):
-                    policy_arn = policy["Arn"]
-                    policy_name = policy["PolicyName"]
-                    try:
-                        # Detach from all entities first
-                        if not self.dry_run:
-                            # Detach from users
-                            users = iam.list_entities_for_policy(
-                                PolicyArn=policy_arn, EntityFilter="User"
-                            ).get("PolicyUsers", [])
-                            for user in users:
-                                iam.detach_user_policy(UserName=user["UserName"], PolicyArn=policy_arn)
-                            # Detach from roles
-                            roles = iam.list_entities_for_policy(
-                                PolicyArn=policy_arn, EntityFilter="Role"
-                            ).get("PolicyRoles", [])
-                            for role in roles:
-                                iam.detach_role_policy(RoleName=role["RoleName"], PolicyArn=policy_arn)
-                            # Detach from groups
-                            groups = iam.list_entities_for_policy(
-                                PolicyArn=policy_arn, EntityFilter="Group"
-                            ).get("PolicyGroups", [])
-                            for group in groups:
-                                iam.detach_group_policy(GroupName=group["GroupName"], PolicyArn=policy_arn)
-                            # Delete all versions except default
-                            versions = iam.list_policy_versions(PolicyArn=policy_arn).get("Versions", [])
-                            for version in versions:
-                                if not version["IsDefaultVersion"]:
-                                    iam.delete_policy_version(PolicyArn=policy_arn, VersionId=version["VersionId"])
-                                    
-                        self.log_delete("IAM Policy", policy_name)
-                        if not self.dry_run:
-                            iam.delete_policy(PolicyArn=policy_arn)
-                    except ClientError as e:
-                        self.handle_error("IAM Policy", policy_name, e)
+            policies = self._all(
+                iam, "list_policies", "Policies",
+                Scope="Local", PaginationConfig={"PageSize": 1000},  # Only customer-managed
+            )
         except ClientError as e:
             self.handle_error("IAM", "list_policies", e)
-            
-        # Delete roles (except AWS service-linked and preserved)
+            return
+        self._for_each(delete, policies)
+
+    def _purge_policy(self, iam, policy):
+        policy_arn = policy["Arn"]
+        # list_policies already reports the attachment count, and most policies
+        # have only their default version: try the bare delete first and fall
+        # back to the full purge only if IAM reports a conflict
+        if not policy.get("AttachmentCount"):
+            try:
+                iam.delete_policy(PolicyArn=policy_arn)
+                return
+            except iam.exceptions.DeleteConflictException:
+                pass
+
+        # Detach from all entities first; one unfiltered listing returns users,
+        # roles and groups together. Always list here: AttachmentCount may be
+        # stale by the time the bare delete has failed
+        paginator = iam.get_paginator("list_entities_for_policy")
+        entities = paginator.paginate(PolicyArn=policy_arn).build_full_result()
+        users = entities.get("PolicyUsers", [])
+        roles = entities.get("PolicyRoles", [])
+        groups = entities.get("PolicyGroups", [])
+        versions = self._all(iam, "list_policy_versions", "Versions", PolicyArn=policy_arn)
+        # Detaches and non-default version deletes are independent writes
+        self._for_each(
+            _call,
+            [lambda u=u: iam.detach_user_policy(UserName=u["UserName"], PolicyArn=policy_arn) for u in users]
+            + [lambda r=r: iam.detach_role_policy(RoleName=r["RoleName"], PolicyArn=policy_arn) for r in roles]
+            + [lambda g=g: iam.detach_group_policy(GroupName=g["GroupName"], PolicyArn=policy_arn) for g in groups]
+            + [
+                lambda v=v: iam.delete_policy_version(PolicyArn=policy_arn, VersionId=v["VersionId"])
+                for v in versions if not v["IsDefaultVersion"]
+            ],
+            max_workers=IAM_ENTITY_WORKERS,
+        )
+        iam.delete_policy(PolicyArn=policy_arn)
+
+    def _iam_roles(self, iam):
+        def delete(role_name):
+            try:
+                if not self.dry_run:
+                    attached = self._all(iam, "list_attached_role_policies", "AttachedPolicies", RoleName=role_name)
+                    inline = self._all(iam, "list_role_policies", "PolicyNames", RoleName=role_name)
+                    profiles = self._all(iam, "list_instance_profiles_for_role", "InstanceProfiles", RoleName=role_name)
+                    # Detach managed policies, delete inline policies and leave
+                    # instance profiles concurrently
+                    self._for_each(
+                        _call,
+                        [lambda p=p: iam.detach_role_policy(RoleName=role_name, PolicyArn=p["PolicyArn"]) for p in attached]
+                        + [lambda n=n: iam.delete_role_policy(RoleName=role_name, PolicyName=n) for n in inline]
+                        + [
+                            lambda p=p: iam.remove_role_from_instance_profile(
+                                InstanceProfileName=p["InstanceProfileName"], RoleName=role_name
+                            )
+                            for p in profiles
+                        ],
+                        max_workers=IAM_ENTITY_WORKERS,
+                    )
+
+                self.log_delete("IAM Role", role_name)
+                if not self.dry_run:
+                    iam.delete_role(RoleName=role_name)
+            except ClientError as e:
+                self.handle_error("IAM Role", role_name, e)
+
         try:
-            paginator = iam.get_paginator("list_roles")
-            for page in paginator.paginate():
-                for role in page.get("Roles", []):
-                    role_name = role["RoleName"]
-                    # Skip AWS service-linked roles and AWS reserved paths
-                    if role["Path"].startswith("/aws-service-role/") or \
-                       role["Path"].startswith("/service-role/") or \
-                       role_name.startswith("AWSServiceRole"):
-                        continue
-                    try:
-                        if not self.dry_run:
-                            # Detach managed policies
-                            attached = iam.list_attached_role_policies(RoleName=role_name).get("AttachedPolicies", [])
-                            for policy in attached:
-                                iam.detach_role_policy(RoleName=role_name, PolicyArn=policy["PolicyArn"])
-                            # Delete inline policies
-                            inline = iam.list_role_policies(RoleName=role_name).get("PolicyNames", [])
-                            for policy_name in inline:
-                                iam.delete_role_policy(RoleName=role_name, PolicyName=policy_name)
-                            # Remove from instance profiles
-                            profiles = iam.list_instance_profiles_for_role(RoleName=role_name).get("InstanceProfiles", [])
-                            for profile in profiles:
-                                iam.remove_role_from_instance_profile(
-                                    InstanceProfileName=profile["InstanceProfileName"],
-                                    RoleName=role_name
-                                )
-                                
-                        self.log_delete("IAM Role", role_name)
-                        if not self.dry_run:
-                            iam.delete_role(RoleName=role_name)
-                    except ClientError as e:
-                        self.handle_error("IAM Role", role_name, e)
+            # Skip AWS service-linked roles and AWS reserved paths
+            role_names = [
+                role["RoleName"] for role in self._all(iam, "list_roles", "Roles")
+                if not (role["Path"].startswith("/aws-service-role/") or
+                        role["Path"].startswith("/service-role/") or
+                        role["RoleName"].startswith("AWSServiceRole"))
+            ]
         except ClientError as e:
             self.handle_error("IAM", "list_roles", e)
-            
-        # Delete instance profiles
+            return
+        self._for_each(delete, role_names)
+
+    def _iam_instance_profiles(self, iam):
+        def delete(profile):
+            profile_name = profile["InstanceProfileName"]
+            try:
+                self.log_delete("IAM Instance Profile", profile_name)
+                if not self.dry_run:
+                    # Remove roles first
+                    for role in profile.get("Roles", []):
+                        try:
+                            iam.remove_role_from_instance_profile(
+                                InstanceProfileName=profile_name,
+                                RoleName=role["RoleName"]
+                            )
+                        except ClientError:
+                            pass
+                    iam.delete_instance_profile(InstanceProfileName=profile_name)
+            except ClientError as e:
+                self.handle_error("IAM Instance Profile", profile_name, e)
+
         try:
-            paginator = iam.get_paginator("list_instance_profiles")
-            for page in paginator.paginate():
-                for profile in page.get("InstanceProfiles", []):
-                    profile_name = profile["InstanceProfileName"]
-                    try:
-                        self.log_delete("IAM Instance Profile", profile_name)
-                        if not self.dry_run:
-                            # Remove roles first
-                            for role in profile.get("Roles", []):
-                                try:
-                                    iam.remove_role_from_instance_profile(
-                                        InstanceProfileName=profile_name,
-                                        RoleName=role["RoleName"]
-                                    )
-                                except ClientError:
-                                    pass
-                            iam.delete_instance_profile(InstanceProfileName=profile_name)
-                    except ClientError as e:
-                        self.handle_error("IAM Instance Profile", profile_name, e)
+            profiles = self._all(iam, "list_instance_profiles", "InstanceProfiles")
         except ClientError as e:
             self.handle_error("IAM", "list_instance_profiles", e)
-            
-        # Delete users (except preserved)
+            return
+        self._for_each(delete, profiles)
+
+    def _iam_users(self, iam):
+        def delete(user_name):
+            try:
+                if not self.dry_run:
+                    # Everything attached to the user is listed at once...
+                    keys, mfas, groups, attached, inline, certs, ssh_keys = self._for_each(_call, [
+                        lambda: self._all(iam, "list_access_keys", "AccessKeyMetadata", UserName=user_name),
+                        lambda: self._all(iam, "list_mfa_devices", "MFADevices", UserName=user_name),
+                        lambda: self._all(iam, "list_groups_for_user", "Groups", UserName=user_name),
+                        lambda: self._all(iam, "list_attached_user_policies", "AttachedPolicies", UserName=user_name),
+                        lambda: self._all(iam, "list_user_policies", "PolicyNames", UserName=user_name),
+                        lambda: self._all(iam, "list_signing_certificates", "Certificates", UserName=user_name),
+                        lambda: self._all(iam, "list_ssh_public_keys", "SSHPublicKeys", UserName=user_name),
+                    ], max_workers=IAM_ENTITY_WORKERS)
+
+                    def delete_mfa(mfa):
+                        # Deactivation must precede deleting the virtual device
+                        iam.deactivate_mfa_device(UserName=user_name, SerialNumber=mfa["SerialNumber"])
+                        iam.delete_virtual_mfa_device(SerialNumber=mfa["SerialNumber"])
+
+                    def delete_login_profile():
+                        try:
+                            iam.delete_login_profile(UserName=user_name)
+                        except ClientError:
+                            pass
+
+                    # ...then removed
+                    self._for_each(
+                        _call,
+                        [lambda k=k: iam.delete_access_key(UserName=user_name, AccessKeyId=k["AccessKeyId"]) for k in keys]
+                        + [lambda m=m: delete_mfa(m) for m in mfas]
+                        + [lambda g=g: iam.remove_user_from_group(GroupName=g["GroupName"], UserName=user_name) for g in groups]
+                        + [lambda p=p: iam.detach_user_policy(UserName=user_name, PolicyArn=p["PolicyArn"]) for p in attached]
+                        + [lambda n=n: iam.delete_user_policy(UserName=user_name, PolicyName=n) for n in inline]
+                        + [delete_login_profile]
+                        + [lambda c=c: iam.delete_signing_certificate(UserName=user_name, CertificateId=c["CertificateId"]) for c in certs]
+                        + [lambda k=k: iam.delete_ssh_public_key(UserName=user_name, SSHPublicKeyId=k["SSHPublicKeyId"]) for k in ssh_keys],
+                        max_workers=IAM_ENTITY_WORKERS,
+                    )
+
+                self.log_delete("IAM User", user_name)
+                if not self.dry_run:
+                    iam.delete_user(UserName=user_name)
+            except ClientError as e:
+                self.handle_error("IAM User", user_name, e)
+
         try:
-            paginator = iam.get_paginator("list_users")
-            for page in paginator.paginate():
-                for user in page.get("Users", []):
-                    user_name = user["UserName"]
-                    if user_name in PRESERVE_IAM_USERS:
-                        self.log(f"Preserving IAM User: {user_name}")
-                        continue
-                    try:
-                        if not self.dry_run:
-                            # Delete access keys
-                            keys = iam.list_access_keys(UserName=user_name).get("AccessKeyMetadata", [])
-                            for key in keys:
-                                iam.delete_access_key(UserName=user_name, AccessKeyId=key["AccessKeyId"])
-                            # Delete MFA devices
-                            mfas = iam.list_mfa_devices(UserName=user_name).get("MFADevices", [])
-                            for mfa in mfas:
-                                iam.deactivate_mfa_device(UserName=user_name, SerialNumber=mfa["SerialNumber"])
-                                iam.delete_virtual_mfa_device(SerialNumber=mfa["SerialNumber"])
-                            # Remove from groups
-                            groups = iam.list_groups_for_user(UserName=user_name).get("Groups", [])
-                            for group in groups:
-                                iam.remove_user_from_group(GroupName=group["GroupName"], UserName=user_name)
-                            # Detach policies
-                            attached = iam.list_attached_user_policies(UserName=user_name).get("AttachedPolicies", [])
-                            for policy in attached:
-                                iam.detach_user_policy(UserName=user_name, PolicyArn=policy["PolicyArn"])
-                            # Delete inline policies
-                            inline = iam.list_user_policies(UserName=user_name).get("PolicyNames", [])
-                            for policy_name in inline:
-                                iam.delete_user_policy(UserName=user_name, PolicyName=policy_name)
-                            # Delete login profile
-                            try:
-                                iam.delete_login_profile(UserName=user_name)
-                            except ClientError:
-                                pass
-                            # Delete signing certificates
-                            certs = iam.list_signing_certificates(UserName=user_name).get("Certificates", [])
-                            for cert in certs:
-                                iam.delete_signing_certificate(UserName=user_name, CertificateId=cert["CertificateId"])
-                            # Delete SSH public keys
-                            ssh_keys = iam.list_ssh_public_keys(UserName=user_name).get("SSHPublicKeys", [])
-                            for ssh_key in ssh_keys:
-                                iam.delete_ssh_public_key(UserName=user_name, SSHPublicKeyId=ssh_key["SSHPublicKeyId"])
-                                
-                        self.log_delete("IAM User", user_name)
-                        if not self.dry_run:
-                            iam.delete_user(UserName=user_name)
-                    except ClientError as e:
-                        self.handle_error("IAM User", user_name, e)
+            user_names = [user["UserName"] for user in self._all(iam, "list_users", "Users")]
         except ClientError as e:
             self.handle_error("IAM", "list_users", e)
-            
-        # Delete groups
+            return
+        for user_name in user_names:
+            if user_name in PRESERVE_IAM_USERS:
+                self.log(f"Preserving IAM User: {user_name}")
+        self._for_each(delete, [u for u in user_names if u not in PRESERVE_IAM_USERS])
+
+    def _iam_groups(self, iam):
+        def delete(group_name):
+            try:
+                if not self.dry_run:
+                    # List attached and inline policies together, then detach
+                    # and delete them all at once
+                    attached, inline = self._for_each(_call, [
+                        lambda: self._all(iam, "list_attached_group_policies", "AttachedPolicies", GroupName=group_name),
+                        lambda: self._all(iam, "list_group_policies", "PolicyNames", GroupName=group_name),
+                    ], max_workers=IAM_ENTITY_WORKERS)
+                    self._for_each(
+                        _call,
+                        [lambda p=p: iam.detach_group_policy(GroupName=group_name, PolicyArn=p["PolicyArn"]) for p in attached]
+                        + [lambda n=n: iam.delete_group_policy(GroupName=group_name, PolicyName=n) for n in inline],
+                        max_workers=IAM_ENTITY_WORKERS,
+                    )
+
+                self.log_delete("IAM Group", group_name)
+                if not self.dry_run:
+                    iam.delete_group(GroupName=group_name)
+            except ClientError as e:
+                self.handle_error("IAM Group", group_name, e)
+
         try:
-            paginator = iam.get_paginator("list_groups")
-            for page in paginator.paginate():
-                for group in page.get("Groups", []):
-                    group_name = group["GroupName"]
-                    try:
-                        if not self.dry_run:
-                            # Detach policies
-                            attached = iam.list_attached_group_policies(GroupName=group_name).get("AttachedPolicies", [])
-                            for policy in attached:
-                                iam.detach_group_policy(GroupName=group_name, PolicyArn=policy["PolicyArn"])
-                            # Delete inline policies
-                            inline = iam.list_group_policies(GroupName=group_name).get("PolicyNames", [])
-                            for policy_name in inline:
-                                iam.delete_group_policy(GroupName=group_name, PolicyName=policy_name)
-                                
-                        self.log_delete("IAM Group", group_name)
-                        if not self.dry_run:
-                            iam.delete_group(GroupName=group_name)
-                    except ClientError as e:
-                        self.handle_error("IAM Group", group_name, e)
+            group_names = [group["GroupName"] for group in self._all(iam, "list_groups", "Groups")]
         except ClientError as e:
             self.handle_error("IAM", "list_groups", e)
+            return
+        self._for_each(delete, group_names)
 
     # =========================================================================
     # CloudFormation Cleanup
@@ -660,27 +893,68 @@ class AWSAccountReset:
     def delete_cloudformation_stacks(self, region):
         """Delete all CloudFormation stacks"""
         self.log(f"=== Cleaning CloudFormation Stacks ({region}) ===")
-        cfn = self.session.client("cloudformation", region_name=region)
-        
+        cfn = self.client("cloudformation", region)
+
+        def delete(stack_name):
+            try:
+                self.log_delete("CloudFormation Stack", stack_name, region)
+                if not self.dry_run:
+                    cfn.delete_stack(StackName=stack_name)
+            except ClientError as e:
+                self.handle_error("CloudFormation Stack", stack_name, e)
+
+        def wait_deleted(stack_name):
+            try:
+                cfn.get_waiter("stack_delete_complete").wait(
+                    StackName=stack_name, WaiterConfig={"Delay": 5, "MaxAttempts": 120}
+                )
+            except WaiterError as e:
+                self.handle_error("CloudFormation Stack", f"wait {stack_name}", e)
+
         try:
-            paginator = cfn.get_paginator("list_stacks")
-            for page in paginator.paginate(StackStatusFilter=[
+            stacks = self._all(cfn, "list_stacks", "StackSummaries", StackStatusFilter=[
                 "CREATE_COMPLETE", "UPDATE_COMPLETE", "ROLLBACK_COMPLETE",
                 "UPDATE_ROLLBACK_COMPLETE", "IMPORT_COMPLETE", "IMPORT_ROLLBACK_COMPLETE"
-            ]):
-                for stack in page.get("StackSummaries", []):
-                    stack_name = stack["StackName"]
-                    # Skip nested stacks (they'll be deleted with parent)
-                    if stack.get("ParentId"):
-                        continue
-                    try:
-                        self.log_delete("CloudFormation Stack", stack_name, region)
-                        if not self.dry_run:
-                            cfn.delete_stack(StackName=stack_name)
-                    except ClientError as e:
-                        self.handle_error("CloudFormation Stack", stack_name, e)
+            ])
+            # Skip nested stacks (they'll be deleted with parent)
+            root_stacks = {s["StackId"]: s["StackName"] for s in stacks if not s.get("ParentId")}
+            waves = self._stack_waves(cfn, root_stacks)
         except ClientError as e:
             self.handle_error("CloudFormation", f"list_stacks ({region})", e)
+            return
+
+        # Each wave is deleted in parallel; an exporting stack can't be deleted
+        # while an importer still exists, so later waves wait for earlier ones
+        for i, wave in enumerate(waves):
+            self._for_each(delete, wave, max_workers=16)
+            if i < len(waves) - 1 and not self.dry_run:
+                self._for_each(wait_deleted, wave, max_workers=16)
+
+    def _stack_waves(self, cfn, stacks):
+        """Order stacks (id -> name) into deletion waves, importers before exporters"""
+        names = set(stacks.values())
+        importers = {name: set() for name in names}  # exporter -> stacks importing from it
+        exports = [e for e in self._all(cfn, "list_exports", "Exports") if e["ExportingStackId"] in stacks]
+
+        def imported_by(export):
+            try:
+                return self._all(cfn, "list_imports", "Imports", ExportName=export["Name"])
+            except ClientError:
+                return []  # CloudFormation rejects the call for exports nobody imports
+
+        for export, stack_names in zip(exports, self._for_each(imported_by, exports)):
+            exporter = stacks[export["ExportingStackId"]]
+            importers[exporter].update(n for n in stack_names if n in names and n != exporter)
+
+        waves = []
+        while importers:
+            wave = [name for name, deps in importers.items() if not deps & importers.keys()]
+            if not wave:  # Circular imports can't be ordered; try the rest together
+                wave = list(importers)
+            waves.append(wave)
+            for name in wave:
+                del importers[name]
+        return waves
 
     # =========================================================================
     # Secrets Manager Cleanup
@@ -688,27 +962,29 @@ class AWSAccountReset:
     def delete_secrets(self, region):
         """Delete all Secrets Manager secrets"""
         self.log(f"=== Cleaning Secrets Manager ({region}) ===")
-        sm = self.session.client("secretsmanager", region_name=region)
-        
+        sm = self.client("secretsmanager", region)
+
+        def delete(secret_name):
+            try:
+                self.log_delete("Secret", secret_name, region)
+                if not self.dry_run:
+                    sm.delete_secret(
+                        SecretId=secret_name,
+                        ForceDeleteWithoutRecovery=True
+                    )
+            except ClientError as e:
+                self.handle_error("Secret", secret_name, e)
+
         try:
-            paginator = sm.get_paginator("list_secrets")
-            for page in paginator.paginate():
-                for secret in page.get("SecretList", []):
-                    secret_name = secret["Name"]
-                    # Skip AWS-managed secrets
-                    if secret.get("OwningService"):
-                        continue
-                    try:
-                        self.log_delete("Secret", secret_name, region)
-                        if not self.dry_run:
-                            sm.delete_secret(
-                                SecretId=secret_name,
-                                ForceDeleteWithoutRecovery=True
-                            )
-                    except ClientError as e:
-                        self.handle_error("Secret", secret_name, e)
+            # Skip AWS-managed secrets
+            secret_names = [
+                secret["Name"] for secret in self._all(sm, "list_secrets", "SecretList")
+                if not secret.get("OwningService")
+            ]
         except ClientError as e:
             self.handle_error("Secrets Manager", f"list_secrets ({region})", e)
+            return
+        self._for_each(delete, secret_names, max_workers=16)
 
     # =========================================================================
     # Step Functions Cleanup
@@ -716,22 +992,24 @@ class AWSAccountReset:
     def delete_step_functions(self, region):
         """Delete all Step Functions state machines"""
         self.log(f"=== Cleaning Step Functions ({region}) ===")
-        sfn = self.session.client("stepfunctions", region_name=region)
-        
+        sfn = self.client("stepfunctions", region)
+
+        def delete(sm):
+            sm_arn = sm["stateMachineArn"]
+            sm_name = sm["name"]
+            try:
+                self.log_delete("Step Function", sm_name, region)
+                if not self.dry_run:
+                    sfn.delete_state_machine(stateMachineArn=sm_arn)
+            except ClientError as e:
+                self.handle_error("Step Function", sm_name, e)
+
         try:
-            paginator = sfn.get_paginator("list_state_machines")
-            for page in paginator.paginate():
-                for sm in page.get("stateMachines", []):
-                    sm_arn = sm["stateMachineArn"]
-                    sm_name = sm["name"]
-                    try:
-                        self.log_delete("Step Function", sm_name, region)
-                        if not self.dry_run:
-                            sfn.delete_state_machine(stateMachineArn=sm_arn)
-                    except ClientError as e:
-                        self.handle_error("Step Function", sm_name, e)
+            machines = self._all(sfn, "list_state_machines", "stateMachines")
         except ClientError as e:
             self.handle_error("Step Functions", f"list_state_machines ({region})", e)
+            return
+        self._for_each(delete, machines, max_workers=16)
 
     # =========================================================================
     # KMS Cleanup
@@ -739,28 +1017,36 @@ class AWSAccountReset:
     def schedule_kms_key_deletion(self, region):
         """Schedule deletion of customer-managed KMS keys"""
         self.log(f"=== Scheduling KMS Key Deletion ({region}) ===")
-        kms = self.session.client("kms", region_name=region)
-        
+        kms = self.client("kms", region)
+
+        def schedule(key_id):
+            try:
+                # Check if customer managed
+                key_info = kms.describe_key(KeyId=key_id)["KeyMetadata"]
+                if key_info["KeyManager"] != "CUSTOMER":
+                    return
+                if key_info["KeyState"] in ["PendingDeletion", "Disabled"]:
+                    return
+
+                self.log_delete("KMS Key (scheduled)", key_id, region)
+                if not self.dry_run:
+                    kms.schedule_key_deletion(KeyId=key_id, PendingWindowInDays=7)
+            except ClientError as e:
+                self.handle_error("KMS Key", key_id, e)
+
         try:
-            paginator = kms.get_paginator("list_keys")
-            for page in paginator.paginate():
-                for key in page.get("Keys", []):
-                    key_id = key["KeyId"]
-                    try:
-                        # Check if customer managed
-                        key_info = kms.describe_key(KeyId=key_id)["KeyMetadata"]
-                        if key_info["KeyManager"] != "CUSTOMER":
-                            continue
-                        if key_info["KeyState"] in ["PendingDeletion", "Disabled"]:
-                            continue
-                            
-                        self.log_delete("KMS Key (scheduled)", key_id, region)
-                        if not self.dry_run:
-                            kms.schedule_key_deletion(KeyId=key_id, PendingWindowInDays=7)
-                    except ClientError as e:
-                        self.handle_error("KMS Key", key_id, e)
+            # Keys behind alias/aws/* are AWS-managed: skip them without a
+            # describe_key round trip
+            aws_managed = {
+                alias["TargetKeyId"] for alias in self._all(kms, "list_aliases", "Aliases")
+                if alias["AliasName"].startswith("alias/aws/") and "TargetKeyId" in alias
+            }
+            key_ids = [key["KeyId"] for key in self._all(kms, "list_keys", "Keys") if key["KeyId"] not in aws_managed]
         except ClientError as e:
             self.handle_error("KMS", f"list_keys ({region})", e)
+            return
+        # The remaining keys still need describe_key to check their manager; overlap them
+        self._for_each(schedule, key_ids, max_workers=16)
 
     # =========================================================================
     # ECR Cleanup
@@ -768,21 +1054,22 @@ class AWSAccountReset:
     def delete_ecr_repositories(self, region):
         """Delete all ECR repositories and images"""
         self.log(f"=== Cleaning ECR Repositories ({region}) ===")
-        ecr = self.session.client("ecr", region_name=region)
-        
+        ecr = self.client("ecr", region)
+
+        def delete(repo_name):
+            try:
+                self.log_delete("ECR Repository", repo_name, region)
+                if not self.dry_run:
+                    ecr.delete_repository(repositoryName=repo_name, force=True)
+            except ClientError as e:
+                self.handle_error("ECR Repository", repo_name, e)
+
         try:
-            paginator = ecr.get_paginator("describe_repositories")
-            for page in paginator.paginate():
-                for repo in page.get("repositories", []):
-                    repo_name = repo["repositoryName"]
-                    try:
-                        self.log_delete("ECR Repository", repo_name, region)
-                        if not self.dry_run:
-                            ecr.delete_repository(repositoryName=repo_name, force=True)
-                    except ClientError as e:
-                        self.handle_error("ECR Repository", repo_name, e)
+            repo_names = [repo["repositoryName"] for repo in self._all(ecr, "describe_repositories", "repositories")]
         except ClientError as e:
             self.handle_error("ECR", f"describe_repositories ({region})", e)
+            return
+        self._for_each(delete, repo_names, max_workers=16)
 
     # =========================================================================
     # Main Cleanup Orchestration
@@ -794,22 +1081,51 @@ class AWSAccountReset:
         self.log(f"{'='*60}\n")
         
         # Order matters - delete dependent resources first
-        self.delete_cloudformation_stacks(region)
-        time.sleep(2)  # Wait for stack deletion to start
-        
-        self.delete_lambda_functions(region)
-        self.delete_api_gateways(region)
-        self.delete_step_functions(region)
-        self.delete_sqs_queues(region)
-        self.delete_sns_topics(region)
-        self.delete_eventbridge_rules(region)
-        self.delete_dynamodb_tables(region)
-        self.delete_cognito_resources(region)
-        self.delete_secrets(region)
-        self.delete_ecr_repositories(region)
-        self.delete_cloudwatch_resources(region)
-        self.delete_ec2_resources(region)
-        self.schedule_kms_key_deletion(region)
+        # delete_stack returns once deletion has started, so no pause is needed
+        if "cloudformation" in self.services:
+            self.delete_cloudformation_stacks(region)
+
+        # These services don't depend on one another, so clean them all at once
+        independent = [fn for service, fn in (
+            ("lambda", self.delete_lambda_functions),
+            ("apigateway", self.delete_api_gateways),
+            ("stepfunctions", self.delete_step_functions),
+            ("sqs", self.delete_sqs_queues),
+            ("sns", self.delete_sns_topics),
+            ("eventbridge", self.delete_eventbridge_rules),
+            ("dynamodb", self.delete_dynamodb_tables),
+            ("cognito", self.delete_cognito_resources),
+            ("secretsmanager", self.delete_secrets),
+            ("ecr", self.delete_ecr_repositories),
+            ("cloudwatch", self.delete_cloudwatch_resources),
+        ) if service in self.services]
+        if independent:
+            self._for_each(lambda delete: delete(region), independent, max_workers=len(independent))
+
+        # EC2 after Lambda (VPC ENIs hold security groups), KMS last since
+        # other services may still be encrypting with its keys
+        if "ec2" in self.services:
+            self.delete_ec2_resources(region)
+        if "kms" in self.services:
+            self.schedule_kms_key_deletion(region)
+
+    def enabled_regions(self):
+        """Regions this account can use; opt-in regions not yet enabled are excluded"""
+        try:
+            regions = self.client("ec2", "us-east-1").describe_regions(AllRegions=False)["Regions"]
+        except ClientError as e:
+            self.handle_error("EC2", "describe_regions", e)
+            return None
+        return {r["RegionName"] for r in regions}
+
+    def run_region(self, region):
+        """Clean one region, recording failures instead of raising"""
+        try:
+            self.cleanup_region(region)
+        except EndpointConnectionError:
+            self.log(f"Region {region} not available, skipping", "WARN")
+        except Exception as e:
+            self.handle_error("Region", region, e)
         
     def run(self):
         """Run the full account cleanup"""
@@ -821,48 +1137,68 @@ class AWSAccountReset:
             print("\n🔍 DRY RUN MODE - No resources will be deleted")
         else:
             print("\n⚠️  EXECUTE MODE - Resources WILL be deleted!")
-            print("\nYou have 10 seconds to cancel (Ctrl+C)...")
-            time.sleep(10)
+            # Interactive runs confirm explicitly instead of waiting out a fixed
+            # countdown; non-interactive runs (CI) already opted in via --execute
+            if sys.stdin.isatty() and input("\nType DELETE to continue: ").strip() != "DELETE":
+                print("Aborted.")
+                return
             
         # Get current identity
-        sts = self.session.client("sts")
+        sts = self.client("sts")
         identity = sts.get_caller_identity()
         print(f"\nAccount: {identity['Account']}")
         print(f"User: {identity['Arn']}")
         print(f"Preserving IAM users: {PRESERVE_IAM_USERS}")
-        print(f"Regions to clean: {REGIONS_TO_CLEAN}")
+        print(f"Services to clean: {', '.join(s for s in SERVICES if s in self.services)}")
+
+        # Disabled regions would only fail every call after paying for client
+        # setup and a TLS handshake, so drop them before fanning out
+        regions = list(REGIONS_TO_CLEAN)
+        enabled = self.enabled_regions()
+        if enabled is not None:
+            for region in regions:
+                if region not in enabled:
+                    self.log(f"Region {region} not enabled for this account, skipping", "WARN")
+            regions = [r for r in regions if r in enabled]
+        self.flush_log()
+        print(f"Regions to clean: {regions}")
         
         # Global resources first
-        self.delete_s3_buckets()
-        self.delete_iam_resources()
+        if "s3" in self.services:
+            self.delete_s3_buckets()
+        if "iam" in self.services:
+            self.delete_iam_resources()
         
-        # Regional resources
-        for region in REGIONS_TO_CLEAN:
-            try:
-                self.cleanup_region(region)
-            except EndpointConnectionError:
-                self.log(f"Region {region} not available, skipping", "WARN")
-            except Exception as e:
-                self.handle_error("Region", region, e)
+        # Regional resources: each region is an independent set of endpoints,
+        # so clean them all at once (order within a region is preserved)
+        if regions and self.services - {"s3", "iam"}:
+            with ThreadPoolExecutor(max_workers=len(regions)) as executor:
+                futures = [executor.submit(self.run_region, region) for region in regions]
+                for future in as_completed(futures):
+                    future.result()
+        self.finish_ec2_terminations()
+        self.flush_log()
                 
-        # Summary
-        print("\n" + "="*60)
-        print("CLEANUP SUMMARY")
-        print("="*60)
-        print(f"\nResources {'to delete' if self.dry_run else 'deleted'}: {len(self.deleted_resources)}")
-        print(f"Errors encountered: {len(self.errors)}")
+        # Summary, assembled first and written in one call
+        lines = [
+            "\n" + "="*60,
+            "CLEANUP SUMMARY",
+            "="*60,
+            f"\nResources {'to delete' if self.dry_run else 'deleted'}: {len(self.deleted_resources)}",
+            f"Errors encountered: {len(self.errors)}",
+        ]
         
         if self.errors:
-            print("\nErrors:")
-            for resource_type, resource_id, error in self.errors[:20]:
-                print(f"  - {resource_type} {resource_id}: {error}")
+            lines.append("\nErrors:")
+            lines.extend(f"  - {t} {i}: {e}" for t, i, e in self.errors[:20])
             if len(self.errors) > 20:
-                print(f"  ... and {len(self.errors) - 20} more errors")
+                lines.append(f"  ... and {len(self.errors) - 20} more errors")
                 
         if self.dry_run:
-            print("\n✅ Dry run complete. Run with --execute to actually delete resources.")
+            lines.append("\n✅ Dry run complete. Run with --execute to actually delete resources.")
         else:
-            print("\n✅ Cleanup complete!")
+            lines.append("\n✅ Cleanup complete!")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -885,6 +1221,22 @@ def main():
         nargs="+",
         help="Specific regions to clean (default: common regions)"
     )
+    services = parser.add_mutually_exclusive_group()
+    services.add_argument(
+        "--only",
+        nargs="+",
+        choices=SERVICES,
+        metavar="SERVICE",
+        help=f"Clean only these services ({', '.join(SERVICES)})"
+    )
+    services.add_argument(
+        "--skip",
+        nargs="+",
+        choices=SERVICES,
+        default=[],
+        metavar="SERVICE",
+        help="Leave these services untouched, e.g. --skip kms iam"
+    )
     
     args = parser.parse_args()
     
@@ -892,7 +1244,8 @@ def main():
         global REGIONS_TO_CLEAN
         REGIONS_TO_CLEAN = args.regions
         
-    resetter = AWSAccountReset(dry_run=args.dry_run)
+    selected = args.only or [s for s in SERVICES if s not in args.skip]
+    resetter = AWSAccountReset(dry_run=args.dry_run, services=selected)
     
     try:
         resetter.run()
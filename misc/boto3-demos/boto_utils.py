@@ -0,0 +1,40 @@
+"""
+Shared session helper for the boto3 demo scripts.
+
+Every boto3.Session() starts with its own botocore data loader, which
+re-reads and re-parses the service model JSON the first time each client is
+built. When several of these scripts run in one Python process (a CI job, a
+notebook, a driver calling their main() functions), giving their sessions
+the same loader means each model is parsed once.
+
+Only the loader is shared: each call still returns an independent session,
+so one script's profile or region never leaks into another's.
+"""
+
+from functools import lru_cache
+
+import boto3
+import botocore.session
+from botocore.loaders import Loader, create_loader
+
+
+@lru_cache(maxsize=None)
+def _shared_loader() -> Loader:
+    # The loader caches parsed models and holds no per-session state
+    return create_loader()
+
+
+def get_session(profile: str = None, region: str = None) -> boto3.Session:
+    """
+    Return a new boto3 Session that reuses the process-wide model loader.
+
+    Args:
+        profile: AWS profile name (optional)
+        region: AWS region (optional)
+
+    Returns:
+        boto3 Session sharing loaded service models with earlier calls
+    """
+    botocore_session = botocore.session.Session(profile=profile)
+    botocore_session.register_component('data_loader', _shared_loader())
+    return boto3.Session(botocore_session=botocore_session, region_name=region)
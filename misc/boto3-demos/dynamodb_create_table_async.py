@@ -6,6 +6,11 @@ Demonstrates async/await patterns for DynamoDB operations using aioboto3.
 Useful for high-throughput applications or when integrating with async frameworks
 like FastAPI, aiohttp, or asyncio-based applications.
 
+aioboto3 earns its setup cost when many calls are in flight at once (the
+fan-out below). For a one-off call, wrapping plain boto3 in
+asyncio.to_thread is faster and still keeps the event loop free; see
+create_table_via_thread().
+
 Prerequisites:
     pip install aioboto3
 
@@ -18,6 +23,8 @@ variables or AWS config files.
 
 import asyncio
 
+import boto3
+
 try:
     import aioboto3
 except ImportError:
@@ -27,10 +34,31 @@ except ImportError:
 
 
 TABLE_NAME = "NotesAsync"
+SCRATCH_TABLE_COUNT = 2  # extra tables created alongside it, then deleted; async only pays off when calls overlap
 REGION = "us-west-1"
 
+# Same key schema and provisioned capacity for every table in the demo
+TABLE_DEFINITION = {
+    'KeySchema': [
+        {
+            'AttributeName': 'ID',
+            'KeyType': 'HASH'  # Partition key only (simple primary key)
+        }
+    ],
+    'AttributeDefinitions': [
+        {
+            'AttributeName': 'ID',
+            'AttributeType': 'S'  # String type
+        }
+    ],
+    'ProvisionedThroughput': {
+        'ReadCapacityUnits': 5,
+        'WriteCapacityUnits': 5
+    }
+}
+
 
-async def create_dynamodb_table():
+async def create_dynamodb_table(dynamodb, table_name):
     """
     Create a DynamoDB table asynchronously using aioboto3.
     
@@ -39,75 +67,90 @@ async def create_dynamodb_table():
     - Use 'await' for all API calls
     - Use async waiters for table creation
     
+    Args:
+        dynamodb: aioboto3 DynamoDB resource, shared so every table
+            reuses the same HTTP connection pool
+        table_name: Name of the table to create
+    
     Returns:
         Table status after creation
     """
-    print(f"Creating DynamoDB table '{TABLE_NAME}' in {REGION}...")
-    print("-" * 50)
+    print(f"Creating DynamoDB table '{table_name}' in {REGION}...")
+
+    # Create the table asynchronously
+    table = await dynamodb.create_table(TableName=table_name, **TABLE_DEFINITION)
+
+    print(f"Table creation initiated for '{table_name}'...")
+
+    # Wait for the table to be created using async waiter
+    # The waiter polls the table status until it becomes ACTIVE; while this
+    # coroutine is suspended the event loop keeps the other tables' waiters going
+    waiter = table.meta.client.get_waiter('table_exists')
+    await waiter.wait(TableName=table_name)
+
+    # Reload table attributes after waiting
+    await table.reload()
+
+    print(f"\n✓ Table created successfully!")
+    print(f"  Table name: {table.table_name}")
+    print(f"  Status: {table.table_status}")
+    print(f"  Item count: {table.item_count}")
+    print(f"  ARN: {table.table_arn}")
+
+    return table.table_status
+
+
+def _create_table_sync(table_name):
+    """Plain boto3 create + wait with the same definition as the async path."""
+    table = boto3.resource('dynamodb', region_name=REGION).create_table(
+        TableName=table_name, **TABLE_DEFINITION
+    )
+    table.wait_until_exists()
+    return table
+
+
+def _delete_table_sync(table_name):
+    """Plain boto3 delete + wait, so the thread table is gone when main() returns."""
+    table = boto3.resource('dynamodb', region_name=REGION).Table(table_name)
+    table.delete()
+    table.wait_until_not_exists()
+
+
+async def create_table_via_thread(table_name):
+    """
+    Create a single table from async code without aioboto3.
     
-    # Create an async session
-    session = aioboto3.Session()
+    asyncio.to_thread runs the blocking boto3 calls on a worker thread, so
+    the event loop keeps serving other tasks while avoiding aiohttp's
+    per-session setup, which dominates when there's only one call to make.
     
-    # Use async context manager for the resource
-    async with session.resource('dynamodb', region_name=REGION) as dynamodb:
-        
-        # Create the table asynchronously
-        table = await dynamodb.create_table(
-            TableName=TABLE_NAME,
-            KeySchema=[
-                {
-                    'AttributeName': 'ID',
-                    'KeyType': 'HASH'  # Partition key only (simple primary key)
-                }
-            ],
-            AttributeDefinitions=[
-                {
-                    'AttributeName': 'ID',
-                    'AttributeType': 'S'  # String type
-                }
-            ],
-            ProvisionedThroughput={
-                'ReadCapacityUnits': 5,
-                'WriteCapacityUnits': 5
-            }
-        )
-        
-        print(f"Table creation initiated...")
-        
-        # Wait for the table to be created using async waiter
-        # The waiter polls the table status until it becomes ACTIVE
-        waiter = table.meta.client.get_waiter('table_exists')
-        await waiter.wait(TableName=TABLE_NAME)
-        
-        # Reload table attributes after waiting
-        await table.reload()
-        
-        print(f"\n✓ Table created successfully!")
-        print(f"  Table name: {table.table_name}")
-        print(f"  Status: {table.table_status}")
-        print(f"  Item count: {table.item_count}")
-        print(f"  ARN: {table.table_arn}")
-        
-        return table.table_status
+    Returns:
+        Table status after creation
+    """
+    print(f"Creating DynamoDB table '{table_name}' via asyncio.to_thread...")
+    table = await asyncio.to_thread(_create_table_sync, table_name)
+    print(f"✓ Table '{table.table_name}' is {table.table_status}")
+    return table.table_status
 
 
-async def cleanup_table():
+async def cleanup_table(dynamodb, table_name):
     """
-    Delete the demo table (optional cleanup).
+    Delete a demo table.
+    
+    Args:
+        dynamodb: The same aioboto3 DynamoDB resource used to create it
+        table_name: Name of the table to delete
     """
-    print(f"\nDeleting table '{TABLE_NAME}'...")
+    print(f"\nDeleting table '{table_name}'...")
     
-    session = aioboto3.Session()
+    table = await dynamodb.Table(table_name)
+    await table.delete()
     
-    async with session.resource('dynamodb', region_name=REGION) as dynamodb:
-        table = await dynamodb.Table(TABLE_NAME)
-        await table.delete()
-        
-        # Wait for deletion
-        waiter = table.meta.client.get_waiter('table_not_exists')
-        await waiter.wait(TableName=TABLE_NAME)
-        
-        print(f"✓ Table '{TABLE_NAME}' deleted.")
+    # Wait for deletion
+    waiter = table.meta.client.get_waiter('table_not_exists')
+    await waiter.wait(TableName=table_name)
+    
+    print(f"✓ Table '{table_name}' deleted.")
 
 
 async def main():
@@ -124,8 +167,31 @@ async def main():
     print("=" * 50)
     
     try:
-        await create_dynamodb_table()
-        
+        scratch_tables = [f"{TABLE_NAME}Scratch{i}" for i in range(1, SCRATCH_TABLE_COUNT + 1)]
+        print(f"Creating {1 + len(scratch_tables)} tables concurrently...")
+        print("-" * 50)
+
+        # One session and resource for the whole demo: creates and cleanup
+        # share its connection pool, and asyncio.gather runs the calls and
+        # waiters at once, so each phase waits about as long as one table.
+        # Only the scratch tables are deleted; TABLE_NAME is left in place.
+        session = aioboto3.Session()
+        async with session.resource('dynamodb', region_name=REGION) as dynamodb:
+            await asyncio.gather(*(
+                create_dynamodb_table(dynamodb, name)
+                for name in [TABLE_NAME, *scratch_tables]
+            ))
+            await asyncio.gather(*(
+                cleanup_table(dynamodb, name) for name in scratch_tables
+            ))
+
+        # Single table: boto3 on a worker thread beats aioboto3 here
+        print("\n" + "-" * 50)
+        thread_table = f"{TABLE_NAME}Thread"
+        await create_table_via_thread(thread_table)
+        await asyncio.to_thread(_delete_table_sync, thread_table)
+        print(f"✓ Table '{thread_table}' deleted.")
+
         print("\n" + "=" * 50)
         print("TIP: Use 'async for' for paginated operations:")
         print("""
@@ -162,9 +162,12 @@ def seed_table(dynamodb):
     
     print(f"\nSeeding table with {len(sample_notes)} items...")
     
-    for note in sample_notes:
-        table.put_item(Item=note)
-        print(f"  ✓ Added note {note['NoteId']} for user {note['UserId']}")
+    # batch_writer buffers puts into BatchWriteItem calls (up to 25 items
+    # each) and resends any unprocessed items automatically
+    with table.batch_writer() as batch:
+        for note in sample_notes:
+            batch.put_item(Item=note)
+            print(f"  ✓ Added note {note['NoteId']} for user {note['UserId']}")
     
     print("\n✓ Seeding complete!")
 
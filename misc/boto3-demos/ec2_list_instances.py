@@ -11,45 +11,49 @@ Usage:
 """
 
 import argparse
+import sys
+
 import boto3
+from botocore.config import Config
 
 
-def list_instances(session: boto3.Session):
+def list_instances(ec2):
     """
     List all EC2 instances in the account/region with key details.
     
     Args:
-        session: boto3 Session to use for credentials
+        ec2: boto3 EC2 client, created once by the caller so repeated calls
+            reuse its connection pool
     """
-    ec2 = session.client('ec2')
-    
-    # Describe all instances
-    response = ec2.describe_instances()
+    # Describe all instances. A single describe_instances call returns only
+    # the first page, so walk every page; 1000 is the largest page EC2 allows
+    paginator = ec2.get_paginator('describe_instances')
     
     instance_count = 0
+    lines = []  # written out in one go instead of ten prints per instance
     
-    for reservation in response['Reservations']:
-        for instance in reservation['Instances']:
-            instance_count += 1
-            
-            # Extract instance name from tags (if present)
-            name = "N/A"
-            for tag in instance.get('Tags', []):
-                if tag['Key'] == 'Name':
-                    name = tag['Value']
-                    break
-            
-            print(f"\nInstance: {instance['InstanceId']}")
-            print(f"  Name:           {name}")
-            print(f"  State:          {instance['State']['Name']}")
-            print(f"  Type:           {instance['InstanceType']}")
-            print(f"  Platform:       {instance.get('PlatformDetails', 'N/A')}")
-            print(f"  Private IP:     {instance.get('PrivateIpAddress', 'N/A')}")
-            print(f"  Public IP:      {instance.get('PublicIpAddress', 'N/A')}")
-            print(f"  VPC:            {instance.get('VpcId', 'N/A')}")
-            print(f"  Subnet:         {instance.get('SubnetId', 'N/A')}")
-            print(f"  Launch Time:    {instance.get('LaunchTime', 'N/A')}")
+    for page in paginator.paginate(PaginationConfig={'PageSize': 1000}):
+        for reservation in page['Reservations']:
+            for instance in reservation['Instances']:
+                instance_count += 1
+                
+                # Extract instance name from tags (if present)
+                name = next((t['Value'] for t in instance.get('Tags', ()) if t['Key'] == 'Name'), "N/A")
+                
+                lines.append(
+                    f"\nInstance: {instance['InstanceId']}\n"
+                    f"  Name:           {name}\n"
+                    f"  State:          {instance['State']['Name']}\n"
+                    f"  Type:           {instance['InstanceType']}\n"
+                    f"  Platform:       {instance.get('PlatformDetails', 'N/A')}\n"
+                    f"  Private IP:     {instance.get('PrivateIpAddress', 'N/A')}\n"
+                    f"  Public IP:      {instance.get('PublicIpAddress', 'N/A')}\n"
+                    f"  VPC:            {instance.get('VpcId', 'N/A')}\n"
+                    f"  Subnet:         {instance.get('SubnetId', 'N/A')}\n"
+                    f"  Launch Time:    {instance.get('LaunchTime', 'N/A')}\n"
+                )
     
+    sys.stdout.write("".join(lines))
     print(f"\n{'=' * 50}")
     print(f"Total instances: {instance_count}")
 
@@ -76,7 +80,8 @@ def main():
     print(f"\nListing EC2 instances in {region}...")
     print("=" * 50)
     
-    list_instances(session)
+    ec2 = session.client('ec2', config=Config(tcp_keepalive=True))
+    list_instances(ec2)
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@
 #
 # Environment Variables:
 #   - TABLE_NAME: DynamoDB table name (default: "Notes")
+#   - DEBUG: set to "1" to log each incoming event
 #
 # Deployment:
 #   1. Create a DynamoDB table with UserId (N) and NoteId (N) keys
@@ -19,33 +20,67 @@
 #   3. Attach IAM role with DynamoDB read permissions
 #   4. Create API Gateway with Lambda integration
 
+import base64
 import json
 import os
-from decimal import Decimal
 import boto3
+from botocore.config import Config
 
 
-# Initialize DynamoDB resource outside handler for connection reuse
-dynamodb = boto3.resource('dynamodb')
+# Initialize the DynamoDB client outside handler for connection reuse;
+# short timeouts keep a slow call inside API Gateway's limit
+dynamodb = boto3.client('dynamodb', config=Config(
+    tcp_keepalive=True,
+    retries={'max_attempts': 2, 'mode': 'standard'},
+    connect_timeout=1,
+    read_timeout=2,
+    parameter_validation=False,
+))
 TABLE_NAME = os.environ.get('TABLE_NAME', 'Notes')
-table = dynamodb.Table(TABLE_NAME)
+_HEADERS = {'Content-Type': 'application/json'}
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+# Logging the full API Gateway event costs a JSON pass plus CloudWatch
+# ingestion on every call, so it's opt-in
+DEBUG = os.environ.get('DEBUG') == '1'
 
 
-class DecimalEncoder(json.JSONEncoder):
+def _number(value):
+    """Parse a DynamoDB number string as int if whole, otherwise float."""
+    if '.' in value or 'e' in value or 'E' in value:
+        return float(value)
+    return int(value)
+
+
+def _is_int(value):
+    """True for an optionally negative integer in ASCII digits, e.g. '42' or '-1'."""
+    digits = value[1:] if value.startswith('-') else value
+    return digits.isascii() and digits.isdigit()
+
+
+def to_json(attr):
     """
-    Custom JSON encoder for Decimal types.
+    Convert one DynamoDB-JSON attribute value (e.g. {'N': '101'}) to a
+    plain JSON-ready value.
     
-    DynamoDB returns numbers as Decimal objects for precision.
-    Standard json.dumps() doesn't know how to serialize Decimal,
-    so we convert them to int or float as appropriate.
+    The low-level client returns numbers as strings, so they are parsed
+    straight to int/float; no Decimal or custom JSONEncoder is involved.
     """
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            # Convert to int if it's a whole number, otherwise float
-            if obj % 1 == 0:
-                return int(obj)
-            return float(obj)
-        return super().default(obj)
+    (kind, value), = attr.items()
+    if kind in ('S', 'BOOL', 'SS'):
+        return value
+    if kind == 'N':
+        return _number(value)
+    if kind == 'M':
+        return {k: to_json(v) for k, v in value.items()}
+    if kind == 'L':
+        return [to_json(v) for v in value]
+    if kind == 'NS':
+        return [_number(v) for v in value]
+    if kind == 'B':
+        return base64.b64encode(value).decode()
+    if kind == 'BS':
+        return [base64.b64encode(v).decode() for v in value]
+    return None  # NULL
 
 
 def lambda_handler(event, context):
@@ -69,7 +104,8 @@ def lambda_handler(event, context):
     Returns:
         API Gateway response with statusCode, headers, and body
     """
-    print(f"Received event: {json.dumps(event)}")
+    if DEBUG:
+        print(f"Received event: {json.dumps(event, separators=(',', ':'))}")
     
     try:
         # Extract path parameters
@@ -79,59 +115,68 @@ def lambda_handler(event, context):
         
         # Validate required parameters
         if not user_id or not note_id:
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'error': 'Missing required path parameters',
-                    'required': ['userId', 'noteId']
-                })
-            }
+            return _MISSING_PARAMS
+        
+        # Keys must be integers in ASCII digits (isdigit alone accepts "²" or
+        # "٣", which DynamoDB rejects); the strings are passed to DynamoDB
+        # as-is, with no int/Decimal round trip
+        if not (_is_int(user_id) and _is_int(note_id)):
+            return _BAD_FORMAT
         
         # Get the note from DynamoDB
-        response = table.get_item(
+        response = dynamodb.get_item(
+            TableName=TABLE_NAME,
             Key={
-                'UserId': int(user_id),
-                'NoteId': int(note_id)
+                'UserId': {'N': user_id},
+                'NoteId': {'N': note_id}
             }
         )
         
         # Check if item exists
         if 'Item' in response:
+            item = {k: to_json(v) for k, v in response['Item'].items()}
             return {
                 'statusCode': 200,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps(response['Item'], cls=DecimalEncoder)
+                'headers': _HEADERS,
+                'body': _dumps(item)
             }
         else:
             return {
                 'statusCode': 404,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
+                'headers': _HEADERS,
+                'body': _dumps({
                     'error': 'Note not found',
                     'userId': user_id,
                     'noteId': note_id
                 })
             }
-            
-    except ValueError as e:
-        # Handle invalid number format
-        return {
-            'statusCode': 400,
-            'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
-                'error': 'Invalid parameter format',
-                'message': 'userId and noteId must be valid integers'
-            })
-        }
-        
+
     except Exception as e:
         print(f"Error: {str(e)}")
         return {
             'statusCode': 500,
-            'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
+            'headers': _HEADERS,
+            'body': _dumps({
                 'error': 'Internal server error',
                 'message': str(e)
             })
         }
+
+
+# Static error responses are serialized once at import
+_MISSING_PARAMS = {
+    'statusCode': 400,
+    'headers': _HEADERS,
+    'body': _dumps({
+        'error': 'Missing required path parameters',
+        'required': ['userId', 'noteId']
+    })
+}
+_BAD_FORMAT = {
+    'statusCode': 400,
+    'headers': _HEADERS,
+    'body': _dumps({
+        'error': 'Invalid parameter format',
+        'message': 'userId and noteId must be valid integers'
+    })
+}
@@ -15,7 +15,17 @@ Usage:
 """
 
 import argparse
+import sys
+
 import boto3
+from botocore.config import Config
+
+from boto_utils import get_session
+
+
+# Both listings send a fixed request shape, so botocore's per-call
+# parameter validation is skipped
+S3_CONFIG = Config(parameter_validation=False)
 
 
 def list_with_client_api(bucket_name: str, session: boto3.Session) -> list:
@@ -36,7 +46,7 @@ def list_with_client_api(bucket_name: str, session: boto3.Session) -> list:
         List of object keys
     """
     # Create a low-level client
-    s3_client = session.client('s3')
+    s3_client = session.client('s3', config=S3_CONFIG)
     
     object_keys = []
     
@@ -44,12 +54,12 @@ def list_with_client_api(bucket_name: str, session: boto3.Session) -> list:
     # Without pagination, list_objects_v2 returns max 1000 objects
     paginator = s3_client.get_paginator('list_objects_v2')
     
-    for page in paginator.paginate(Bucket=bucket_name):
+    for page in paginator.paginate(Bucket=bucket_name, PaginationConfig={'PageSize': 1000}):
         # Response is a dictionary - need to handle missing keys
         contents = page.get('Contents', [])
-        for obj in contents:
-            object_keys.append(obj['Key'])
-            print(f"    {obj['Key']} ({obj['Size']:,} bytes)")
+        object_keys.extend(obj['Key'] for obj in contents)
+        # One write per page rather than one print per object
+        sys.stdout.write("".join(f"    {obj['Key']} ({obj['Size']:,} bytes)\n" for obj in contents))
     
     return object_keys
 
@@ -72,17 +82,18 @@ def list_with_resource_api(bucket_name: str, session: boto3.Session) -> list:
         List of object keys
     """
     # Create a high-level resource
-    s3_resource = session.resource('s3')
+    s3_resource = session.resource('s3', config=S3_CONFIG)
     
     # Get bucket object
     bucket = s3_resource.Bucket(bucket_name)
     
     object_keys = []
     
-    # Iteration handles pagination automatically
-    for obj in bucket.objects.all():
-        object_keys.append(obj.key)
-        print(f"    {obj.key} ({obj.size:,} bytes)")
+    # Iteration handles pagination automatically; .pages() exposes each
+    # 1000-object page so output can be written once per page
+    for page in bucket.objects.page_size(1000).pages():
+        object_keys.extend(obj.key for obj in page)
+        sys.stdout.write("".join(f"    {obj.key} ({obj.size:,} bytes)\n" for obj in page))
     
     return object_keys
 
@@ -153,7 +164,7 @@ def main():
     )
     args = parser.parse_args()
 
-    session = boto3.Session(profile_name=args.profile, region_name=args.region)
+    session = get_session(args.profile, args.region)
     
     print(f"\nComparing Client vs Resource APIs for bucket: {args.bucket}\n")
     
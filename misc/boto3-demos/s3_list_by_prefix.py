@@ -3,7 +3,7 @@
 S3 List Objects by Prefix Demo
 
 Demonstrates how to list S3 objects filtered by a prefix using the boto3
-resource (high-level) API. Useful for organizing objects into logical groups
+client (low-level) API and a ListObjectsV2 paginator. Useful for organizing objects into logical groups
 like folders or categories.
 
 Usage:
@@ -13,7 +13,12 @@ Usage:
 """
 
 import argparse
+import sys
+
 import boto3
+from botocore.config import Config
+
+from boto_utils import get_session
 
 
 def list_objects_by_prefix(bucket_name: str, prefix: str, session: boto3.Session) -> list:
@@ -28,15 +33,20 @@ def list_objects_by_prefix(bucket_name: str, prefix: str, session: boto3.Session
     Returns:
         List of object keys matching the prefix
     """
-    # Use the resource (high-level) API for simpler iteration
-    s3 = session.resource('s3')
-    bucket = s3.Bucket(bucket_name)
+    # Use the client API: pages are plain dicts, so no ObjectSummary is
+    # built per key when only the key and size are needed
+    # Bucket/prefix/page-size is a fixed request shape, so botocore's
+    # per-call parameter validation is skipped
+    s3 = session.client('s3', config=Config(parameter_validation=False))
+    paginator = s3.get_paginator('list_objects_v2')
     
-    # Filter objects by prefix and collect keys
+    # Filter objects by prefix server-side and collect keys
     object_keys = []
-    for obj in bucket.objects.filter(Prefix=prefix):
-        object_keys.append(obj.key)
-        print(f"  {obj.key} ({obj.size:,} bytes)")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix, PaginationConfig={'PageSize': 1000}):
+        contents = page.get('Contents', [])
+        object_keys.extend(obj['Key'] for obj in contents)
+        # One write per page rather than one print per object
+        sys.stdout.write("".join(f"  {obj['Key']} ({obj['Size']:,} bytes)\n" for obj in contents))
     
     return object_keys
 
@@ -68,7 +78,7 @@ def main():
     args = parser.parse_args()
 
     # Create session with optional profile/region
-    session = boto3.Session(profile_name=args.profile, region_name=args.region)
+    session = get_session(args.profile, args.region)
     
     print(f"\nListing objects in s3://{args.bucket}/{args.prefix}\n")
     
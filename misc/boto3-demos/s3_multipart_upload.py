@@ -11,20 +11,89 @@ Key concepts:
 - Upload file in chunks (minimum 5 MB per part, except last)
 - Complete upload by providing all part ETags
 - Abort upload on failure to clean up incomplete parts
+- Or let upload_file + TransferConfig do all of the above (--managed)
 
 Usage:
     python s3_multipart_upload.py --bucket BUCKET --file PATH --key KEY
     python s3_multipart_upload.py --bucket my-bucket --file large.zip --key uploads/large.zip
     python s3_multipart_upload.py --bucket my-bucket --file data.tar.gz --key backups/data.tar.gz --profile prod
+    python s3_multipart_upload.py --bucket my-bucket --file large.zip --key uploads/large.zip --managed
 """
 
 import argparse
+import io
+import mmap
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+from boto_utils import get_session
 
 
 # Minimum part size is 5 MB (required by S3 for all parts except the last)
 CHUNK_SIZE = 5 * 1024 * 1024  # 5 MB
+MAX_WORKERS = 8  # parts uploaded in parallel
+PROGRESS_EVERY = 10  # progress lines are written to stdout in batches of this many parts
+# One connection per upload thread, so no thread waits on the pool; kept
+# alive between parts. Adaptive retries back off client-side when S3
+# throttles. Every part request has the same fixed shape, so botocore's
+# per-call parameter validation is skipped
+S3_CONFIG = Config(
+    max_pool_connections=MAX_WORKERS,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    parameter_validation=False,
+)
+
+
+class PartReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over one part of a memory-mapped file.
+    
+    botocore does not accept a bare memoryview as Body, but it does accept any
+    file object. Reading through a view of the mapping streams the part to the
+    socket in small blocks instead of first copying all 5 MB into a bytes object.
+    """
+
+    def __init__(self, mm: mmap.mmap, offset: int, size: int):
+        self._view = memoryview(mm)[offset:offset + size]
+        self._pos = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = min(len(buffer), len(self._view) - self._pos)
+        buffer[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = offset
+        return offset
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        # The mmap can't be closed while views of it are still exported
+        self._view.release()
+        super().close()
 
 
 def multipart_upload(bucket_name: str, file_path: str, key_name: str, session: boto3.Session) -> bool:
@@ -34,7 +103,8 @@ def multipart_upload(bucket_name: str, file_path: str, key_name: str, session: b
     This approach is more reliable for large files because:
     - Failed parts can be retried individually
     - Upload can be resumed if interrupted
-    - Better network utilization with parallel uploads (not shown here)
+    - Better network utilization with parallel uploads: parts are
+      independent, so up to MAX_WORKERS of them are in flight at once
     
     Args:
         bucket_name: Name of the S3 bucket
@@ -45,49 +115,89 @@ def multipart_upload(bucket_name: str, file_path: str, key_name: str, session: b
     Returns:
         True if upload succeeded, False otherwise
     """
-    s3 = session.resource('s3')
+    s3 = session.resource('s3', config=S3_CONFIG)
     bucket = s3.Bucket(bucket_name)
     
     # Get file size for progress tracking
     file_size = os.path.getsize(file_path)
     print(f"File size: {file_size:,} bytes ({file_size / (1024*1024):.2f} MB)")
+    if file_size == 0:
+        # An empty file can't be memory-mapped, and has no parts to upload
+        print("✗ File is empty; use put_object for zero-byte objects")
+        return False
     
     # Step 1: Initiate multipart upload
     # This returns an upload ID that identifies this specific upload session
-    multipart_upload = bucket.initiate_multipart_upload(Key=key_name)
+    multipart_upload = bucket.Object(key_name).initiate_multipart_upload()
     upload_id = multipart_upload.id
     print(f"Initiated multipart upload (ID: {upload_id[:8]}...)")
     
-    # Track uploaded parts for completing the upload
-    parts = []
-    part_number = 1
+    # Track uploaded parts for completing the upload. Each part has a fixed
+    # slot, so the list comes out in PartNumber order however they finish
+    n_parts = -(-file_size // CHUNK_SIZE)
+    parts = [None] * n_parts
     bytes_uploaded = 0
+    progress_lines = []
+    
+    # Resources aren't thread-safe, so the workers share the underlying
+    # client (which is) and call UploadPart on it directly
+    client = s3.meta.client
+    
+    def upload_part(part_number, offset):
+        # Step 2: Upload each part
+        # Each part gets a unique part number (1-based)
+        body = PartReader(mm, offset, CHUNK_SIZE)
+        size = len(body)
+        try:
+            response = client.upload_part(
+                Bucket=bucket_name,
+                Key=key_name,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+        finally:
+            # Release the view so the mmap can close, even on failure
+            body.close()
+        return part_number, size, response['ETag']
     
     try:
-        with open(file_path, 'rb') as file:
-            while True:
-                # Read next chunk
-                data = file.read(CHUNK_SIZE)
-                if not data:
-                    break
-                
-                # Step 2: Upload each part
-                # Each part gets a unique part number (1-based)
-                part = multipart_upload.Part(part_number)
-                response = part.upload(Body=data)
+        # Map the file instead of reading it chunk by chunk: each worker
+        # streams its own window of the mapping, and the OS pages the data
+        # in as needed
+        with open(file_path, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(upload_part, part_number, offset)
+                for part_number, offset in enumerate(range(0, file_size, CHUNK_SIZE), start=1)
+            ]
+            for future in as_completed(futures):
+                try:
+                    part_number, size, etag = future.result()
+                except Exception:
+                    # Don't start parts that are still queued; the upload is
+                    # about to be aborted anyway
+                    for pending in futures:
+                        pending.cancel()
+                    raise
                 
                 # Store part info for completing upload later
                 # ETag is a hash of the part content used for verification
-                parts.append({
+                parts[part_number - 1] = {
                     'PartNumber': part_number,
-                    'ETag': response['ETag']
-                })
+                    'ETag': etag
+                }
                 
-                bytes_uploaded += len(data)
+                bytes_uploaded += size
                 progress = (bytes_uploaded / file_size) * 100
-                print(f"  Part {part_number}: {len(data):,} bytes (ETag: {response['ETag'][:10]}...) - {progress:.1f}%")
-                
-                part_number += 1
+                progress_lines.append(f"  Part {part_number}: {size:,} bytes (ETag: {etag[:10]}...) - {progress:.1f}%\n")
+                if len(progress_lines) == PROGRESS_EVERY:
+                    sys.stdout.write("".join(progress_lines))
+                    sys.stdout.flush()
+                    progress_lines.clear()
+        
+        sys.stdout.write("".join(progress_lines))
         
         # Step 3: Complete the multipart upload
         # S3 assembles all parts into the final object
@@ -107,6 +217,70 @@ def multipart_upload(bucket_name: str, file_path: str, key_name: str, session: b
         return False
 
 
+class ProgressTracker:
+    """upload_file callback: accumulates bytes sent across transfer threads."""
+
+    def __init__(self, file_size: int):
+        self.file_size = file_size
+        self.bytes_uploaded = 0
+        self._percent = -1
+        self._lock = threading.Lock()
+
+    def __call__(self, bytes_amount: int):
+        # Called for every block each transfer thread sends, so only write
+        # when the whole-number percentage actually moves
+        with self._lock:
+            self.bytes_uploaded += bytes_amount
+            uploaded = self.bytes_uploaded
+            # A zero-byte file is complete as soon as it's sent
+            percent = uploaded * 100 // self.file_size if self.file_size else 100
+            if percent == self._percent:
+                return
+            self._percent = percent
+        sys.stdout.write(f"\r  {uploaded:,} / {self.file_size:,} bytes - {percent}%")
+        sys.stdout.flush()
+
+
+def managed_upload(bucket_name: str, file_path: str, key_name: str, session: boto3.Session) -> bool:
+    """
+    Upload a file with the managed transfer API instead of driving the parts by hand.
+    
+    upload_file (via s3transfer) performs the same initiate / upload parts /
+    complete sequence as multipart_upload, with concurrent parts, bounded
+    memory, and an automatic abort on failure. Prefer it in real code.
+    
+    Args:
+        bucket_name: Name of the S3 bucket
+        file_path: Local path to the file to upload
+        key_name: S3 object key (destination path in bucket)
+        session: boto3 Session to use for credentials
+        
+    Returns:
+        True if upload succeeded, False otherwise
+    """
+    file_size = os.path.getsize(file_path)
+    print(f"File size: {file_size:,} bytes ({file_size / (1024*1024):.2f} MB)")
+    
+    config = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,  # Smaller files go up in a single PUT
+        multipart_chunksize=CHUNK_SIZE,
+        max_concurrency=MAX_WORKERS,
+        use_threads=True,
+    )
+    s3 = session.client('s3', config=S3_CONFIG)
+    
+    try:
+        s3.upload_file(file_path, bucket_name, key_name, Config=config, Callback=ProgressTracker(file_size))
+    except Exception as e:
+        # s3transfer has already aborted the multipart upload
+        print(f"\n✗ Error occurred: {e}")
+        return False
+    
+    print(f"\n✓ Upload completed successfully!")
+    print(f"  Object: s3://{bucket_name}/{key_name}")
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Upload large files to S3 using multipart upload"
@@ -136,6 +310,11 @@ def main():
         default=None,
         help="AWS region (optional)"
     )
+    parser.add_argument(
+        "--managed",
+        action="store_true",
+        help="Use upload_file with TransferConfig instead of the manual multipart calls"
+    )
     args = parser.parse_args()
 
     # Validate file exists
@@ -143,11 +322,12 @@ def main():
         print(f"Error: File not found: {args.file}")
         return
     
-    session = boto3.Session(profile_name=args.profile, region_name=args.region)
+    session = get_session(args.profile, args.region)
     
     print(f"\nUploading {args.file} to s3://{args.bucket}/{args.key}\n")
     
-    multipart_upload(args.bucket, args.file, args.key, session)
+    upload = managed_upload if args.managed else multipart_upload
+    upload(args.bucket, args.file, args.key, session)
 
 
 if __name__ == "__main__":